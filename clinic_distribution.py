@@ -7,20 +7,28 @@ showing the breakdown between "Klinik Utama" and "Klinik Pratama".
 
 The script generates both bar chart and pie chart visualizations following
 the research paper style guide.
+
+Hot path: matplotlib Figure.savefig (SVG path tessellation dominates) + backend
+rasterization, not numeric. The dataset is two integers, so run
+``python clinic_distribution.py --profile`` before reaching for Numba or other
+compute-side optimizations in the data functions.
 """
 
 import matplotlib.pyplot as plt
-import pandas as pd
 from typing import Dict, List, Tuple
 from style_guide import (
     apply_style, 
     save_figure, 
+    show_figure,
+    render_charts,
+    data_signature,
     get_color_palette, 
     configure_bar_plot, 
     configure_pie_plot,
-    add_value_labels,
-    format_percentage_labels,
-    COLORS
+    prepare_counts,
+    CategoryCounts,
+    COLORS,
+    FONTS
 )
 
 # =============================================================================
@@ -39,43 +47,24 @@ def get_clinic_data() -> Dict[str, int]:
         'Klinik Pratama': 38
     }
 
-def create_dataframe(data: Dict[str, int]) -> pd.DataFrame:
-    """
-    Convert clinic data to pandas DataFrame for easier manipulation.
-    
-    Args:
-        data: Dictionary with clinic types and counts
-        
-    Returns:
-        DataFrame with clinic data
-    """
-    df = pd.DataFrame(list(data.items()), columns=pd.Index(['Clinic_Type', 'Count']))
-    df['Percentage'] = (df['Count'] / df['Count'].sum()) * 100
-    # Sort by 'Count' descending for better chart readability
-    df = df.sort_values('Count', ascending=False).reset_index(drop=True)
-    return df
-
 # =============================================================================
 # VISUALIZATION FUNCTIONS
 # =============================================================================
 
-def create_bar_chart(data: Dict[str, int], save_path: str = 'clinic_distribution_bar') -> None:
+def create_bar_chart(prepared: CategoryCounts, save_path: str = 'clinic_distribution_bar') -> None:
     """
     Create a bar chart visualization for clinic distribution.
     
     Args:
-        data: Dictionary with clinic types and counts
+        prepared: Clinic counts prepared by prepare_counts()
         save_path: Path to save the figure (without extension)
     """
-    # Create DataFrame
-    df = create_dataframe(data)
-    
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(10, 6))
     
     # Create bar chart
-    colors = get_color_palette(len(data))
-    bars = ax.bar(df['Clinic_Type'], df['Count'], 
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.bar(prepared.labels, prepared.counts, 
                   color=colors, 
                   edgecolor='white', 
                   linewidth=1.5,
@@ -90,22 +79,22 @@ def create_bar_chart(data: Dict[str, int], save_path: str = 'clinic_distribution
     )
     
     # Add value labels on bars
-    add_value_labels(ax, bars, df['Count'].tolist())
+    ax.bar_label(bars, labels=[f'{count}' for count in prepared.counts],
+                 label_type='edge', padding=2,
+                 fontsize=FONTS['annotation_size'],
+                 color=COLORS['dark_gray'])
     
-    # Add percentage labels as well
-    for i, (bar, count, pct) in enumerate(zip(bars, df['Count'], df['Percentage'])):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height/2,
-                f'{pct:.1f}%',
-                ha='center', va='center',
-                fontsize=11, fontweight='bold',
-                color='white')
+    # Add percentage labels inside the bars as well
+    ax.bar_label(bars, labels=[f'{pct:.1f}%' for pct in prepared.percentages],
+                 label_type='center',
+                 fontsize=11, fontweight='bold',
+                 color='white')
     
     # Customize y-axis
-    ax.set_ylim(0, max(df['Count']) * 1.1)
+    ax.set_ylim(0, max(prepared.counts) * 1.1)
     
     # Add total count annotation
-    total_clinics = df['Count'].sum()
+    total_clinics = prepared.total
     ax.text(0.98, 0.98, f'Total Klinik: {total_clinics}',
             transform=ax.transAxes, 
             ha='right', va='top',
@@ -116,38 +105,33 @@ def create_bar_chart(data: Dict[str, int], save_path: str = 'clinic_distribution
             fontsize=10)
     
     # Save the figure to output directory
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')  # Vector format for Word documents
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)  # SVG: vector format for Word documents
     
-    plt.tight_layout()
-    plt.show()
+    show_figure(fig)
 
-def create_pie_chart(data: Dict[str, int], save_path: str = 'clinic_distribution_pie') -> None:
+def create_pie_chart(prepared: CategoryCounts, save_path: str = 'clinic_distribution_pie') -> None:
     """
     Create a pie chart visualization for clinic distribution.
     
     Args:
-        data: Dictionary with clinic types and counts
+        prepared: Clinic counts prepared by prepare_counts()
         save_path: Path to save the figure (without extension)
     """
-    # Create DataFrame
-    df = create_dataframe(data)
-    
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(8, 8))
     
     # Create pie chart
-    colors = get_color_palette(len(data))
+    colors = get_color_palette(len(prepared.labels))
     
-    # Calculate percentages for display
-    percentages = format_percentage_labels(df['Count'].tolist())
+    # Format the percentages computed once in prepare_counts()
+    percentages = [f'{pct:.1f}%' for pct in prepared.percentages]
     
     # Create labels with both count and percentage
     labels = [f'{clinic_type}\n({count} klinik, {pct})' 
-              for clinic_type, count, pct in zip(df['Clinic_Type'], df['Count'], percentages)]
+              for clinic_type, count, pct in zip(prepared.labels, prepared.counts, percentages)]
     
     pie_result = ax.pie(
-        df['Count'], 
+        prepared.counts, 
         labels=labels,
         colors=colors,
         autopct='',  # We'll add custom labels
@@ -174,7 +158,7 @@ def create_pie_chart(data: Dict[str, int], save_path: str = 'clinic_distribution
     configure_pie_plot(ax, 'Distribusi Klinik Berdasarkan Jenis Klinik')
     
     # Add total count annotation
-    total_clinics = df['Count'].sum()
+    total_clinics = prepared.total
     ax.text(0, -1.3, f'Total Klinik: {total_clinics}',
             ha='center', va='center',
             bbox=dict(boxstyle='round,pad=0.5', 
@@ -187,29 +171,24 @@ def create_pie_chart(data: Dict[str, int], save_path: str = 'clinic_distribution
     ax.set_aspect('equal')
     
     # Save the figure to output directory
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')  # Vector format for Word documents
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)  # SVG: vector format for Word documents
     
-    plt.tight_layout()
-    plt.show()
+    show_figure(fig)
 
-def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'clinic_distribution_horizontal') -> None:
+def create_horizontal_bar_chart(prepared: CategoryCounts, save_path: str = 'clinic_distribution_horizontal') -> None:
     """
     Create a horizontal bar chart visualization for clinic distribution.
     
     Args:
-        data: Dictionary with clinic types and counts
+        prepared: Clinic counts prepared by prepare_counts()
         save_path: Path to save the figure (without extension)
     """
-    # Create DataFrame
-    df = create_dataframe(data)
-    
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(10, 6))
     
     # Create horizontal bar chart
-    colors = get_color_palette(len(data))
-    bars = ax.barh(df['Clinic_Type'], df['Count'], 
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.barh(prepared.labels, prepared.counts, 
                    color=colors, 
                    edgecolor='white', 
                    linewidth=1.5,
@@ -225,19 +204,17 @@ def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'clinic_d
     ax.spines['right'].set_visible(False)
     
     # Add value labels on bars
-    for i, (bar, count, pct) in enumerate(zip(bars, df['Count'], df['Percentage'])):
-        width = bar.get_width()
-        ax.text(width + width*0.02, bar.get_y() + bar.get_height()/2,
-                f'{count} ({pct:.1f}%)',
-                ha='left', va='center',
-                fontsize=11, fontweight='bold',
-                color=COLORS['dark_gray'])
+    ax.bar_label(bars,
+                 labels=[f'{count} ({pct:.1f}%)' for count, pct in zip(prepared.counts, prepared.percentages)],
+                 label_type='edge', padding=3,
+                 fontsize=11, fontweight='bold',
+                 color=COLORS['dark_gray'])
     
     # Customize x-axis
-    ax.set_xlim(0, max(df['Count']) * 1.15)
+    ax.set_xlim(0, max(prepared.counts) * 1.15)
     
     # Add total count annotation
-    total_clinics = df['Count'].sum()
+    total_clinics = prepared.total
     ax.text(0.98, 0.02, f'Total Klinik: {total_clinics}',
             transform=ax.transAxes, 
             ha='right', va='bottom',
@@ -248,30 +225,24 @@ def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'clinic_d
             fontsize=10)
     
     # Save the figure to output directory
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')  # Vector format for Word documents
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)  # SVG: vector format for Word documents
     
-    plt.tight_layout()
-    plt.show()
+    show_figure(fig)
 
-def print_summary_statistics(data: Dict[str, int]) -> None:
+def print_summary_statistics(prepared: CategoryCounts) -> None:
     """
     Print summary statistics for the clinic data.
     
     Args:
-        data: Dictionary with clinic types and counts
+        prepared: Clinic counts prepared by prepare_counts()
     """
-    df = create_dataframe(data)
-    total = df['Count'].sum()
+    total = prepared.total
     
     print("\n" + "="*50)
     print("STATISTIK DISTRIBUSI KLINIK")
     print("="*50)
     
-    for _, row in df.iterrows():
-        clinic_type = row['Clinic_Type']
-        count = row['Count']
-        percentage = row['Percentage']
+    for clinic_type, count, percentage in zip(prepared.labels, prepared.counts, prepared.percentages):
         print(f"{clinic_type:15}: {count:3d} klinik ({percentage:5.1f}%)")
     
     print("-"*50)
@@ -280,41 +251,53 @@ def print_summary_statistics(data: Dict[str, int]) -> None:
     
     # Additional insights
     print("\nWAWASAN KUNCI:")
-    primary_clinic = df.loc[df['Count'].idxmax(), 'Clinic_Type']
-    primary_percentage = df.loc[df['Count'].idxmax(), 'Percentage']
+    # prepare_counts() sorts by count, so the majority type comes first
+    primary_clinic = prepared.labels[0]
+    primary_percentage = prepared.percentages[0]
     print(f"• {primary_clinic} merupakan mayoritas dengan {primary_percentage:.1f}% dari total klinik")
     
-    ratio = df.loc[df['Clinic_Type'] == 'Klinik Pratama', 'Count'].iloc[0] / df.loc[df['Clinic_Type'] == 'Klinik Utama', 'Count'].iloc[0]
+    counts_by_type = dict(zip(prepared.labels, prepared.counts))
+    ratio = counts_by_type['Klinik Pratama'] / counts_by_type['Klinik Utama']
     print(f"• Rasio Klinik Pratama terhadap Klinik Utama: {ratio:.1f}:1")
 
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
 
-def main() -> None:
+def main(force: bool = False) -> None:
     """
     Main function to generate all clinic distribution visualizations.
+    
+    Args:
+        force: Re-render charts even when their outputs are up to date
     """
     # Apply the research paper style
     apply_style()
     
-    # Get the clinic data
+    # Get the clinic data and prepare it once for every chart
     clinic_data = get_clinic_data()
+    prepared = prepare_counts(clinic_data)
     
     # Print summary statistics
-    print_summary_statistics(clinic_data)
+    print_summary_statistics(prepared)
     
     print("\nMembuat visualisasi...")
-    
-    # Create different types of visualizations
     print("\n1. Membuat diagram batang...")
-    create_bar_chart(clinic_data)
-    
-    print("\n2. Membuat diagram lingkaran...")
-    create_pie_chart(clinic_data)
-    
-    print("\n3. Membuat diagram batang horizontal...")
-    create_horizontal_bar_chart(clinic_data)
+    print("2. Membuat diagram lingkaran...")
+    print("3. Membuat diagram batang horizontal...")
+    
+    # Each chart is an independent render + file write, so build them in parallel,
+    # skipping any whose outputs already match the current data and code
+    render_charts(
+        [
+            (create_bar_chart, 'clinic_distribution_bar'),
+            (create_pie_chart, 'clinic_distribution_pie'),
+            (create_horizontal_bar_chart, 'clinic_distribution_horizontal'),
+        ],
+        (prepared,),
+        data_signature(clinic_data, __file__),
+        force=force,
+    )
     
     print("\n✅ Semua visualisasi berhasil dibuat!")
     print("\nFile yang dihasilkan di direktori 'output/':")
@@ -323,4 +306,17 @@ def main() -> None:
     print("• clinic_distribution_horizontal.png/.svg")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate clinic distribution figures")
+    parser.add_argument("--profile", action="store_true",
+                        help="Run main() under cProfile, sorted by cumulative time")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render figures even when their outputs are up to date")
+    args = parser.parse_args()
+
+    if args.profile:
+        import cProfile
+        cProfile.run('main(force=args.force)', sort='cumulative')
+    else:
+        main(force=args.force)
@@ -4,15 +4,22 @@ Spider Chart Rata-rata Tingkat Kematangan Digital Klinik di Kabupaten Ponorogo
 
 Script ini menghasilkan visualisasi spider chart (radar chart) untuk rata-rata tingkat 
 kematangan digital klinik dari 7 dimensi dengan skala 5.
+
+Hot path: matplotlib Figure.savefig (tesselasi path SVG dominan) + rasterisasi
+backend, bukan komputasi numerik. Data hanya berisi 7 nilai, jadi jalankan
+``python digital_maturity_spider_chart.py --profile`` sebelum mencoba Numba atau
+optimasi numerik lain pada fungsi data.
 """
 
 import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from style_guide import (
     apply_style,
     save_figure,
+    show_figure,
+    render_charts,
+    data_signature,
     get_color_palette,
     COLORS
 )
@@ -31,28 +38,53 @@ def get_digital_maturity_data() -> Dict[str, float]:
         'Interoperabilitas': 3.81
     }
 
-def create_spider_chart(data: Dict[str, float], save_path: str = 'digital_maturity_spider') -> None:
+def _build_spider(data: Dict[str, float], figsize: Tuple[float, float], tick_fontsize: int):
     """
-    Membuat spider chart untuk tingkat kematangan digital.
+    Membangun polar axes dan polygon tertutup yang dipakai bersama kedua spider chart.
     
     Args:
         data: Dictionary dengan dimensi dan nilai rata-rata
-        save_path: Path untuk menyimpan figure
+        figsize: Ukuran figure (lebar, tinggi)
+        tick_fontsize: Ukuran font label skala radial
+        
+    Returns:
+        Tuple (fig, ax, angles, values) dengan titik pertama diulang di akhir
     """
     # Persiapan data
-    categories = list(data.keys())
-    values = list(data.values())
+    N = len(data)
+    values = np.fromiter(data.values(), dtype=np.float64, count=N)
     
     # Tambahkan nilai pertama di akhir untuk menutup polygon
-    values += values[:1]
+    values = np.concatenate([values, values[:1]])
     
     # Hitung sudut untuk setiap kategori
-    N = len(categories)
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]
+    angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+    angles = np.concatenate([angles, angles[:1]])
     
     # Buat figure dan axis
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+    fig, ax = plt.subplots(figsize=figsize, subplot_kw=dict(projection='polar'))
+    
+    # Kustomisasi grid dan skala
+    ax.set_xticks(angles[:-1])
+    
+    # Set skala radial (0-5)
+    ax.set_ylim(0, 5)
+    ax.set_yticks([1, 2, 3, 4, 5])
+    ax.set_yticklabels(['1', '2', '3', '4', '5'], fontsize=tick_fontsize)
+    ax.grid(True, alpha=0.3)
+    
+    return fig, ax, angles, values
+
+def create_spider_chart(data: Dict[str, float], save_path: str = 'digital_maturity_spider') -> None:
+    """
+    Membuat spider chart untuk tingkat kematangan digital.
+    
+    Args:
+        data: Dictionary dengan dimensi dan nilai rata-rata
+        save_path: Path untuk menyimpan figure
+    """
+    categories = list(data.keys())
+    fig, ax, angles, values = _build_spider(data, figsize=(10, 10), tick_fontsize=10)
     
     # Warna tetap untuk rata-rata (konsisten untuk kombinasi dengan data lain)
     avg_color = COLORS['primary']  # Menggunakan warna primary yang konsisten
@@ -61,16 +93,9 @@ def create_spider_chart(data: Dict[str, float], save_path: str = 'digital_maturi
     ax.plot(angles, values, 'o-', linewidth=2.5, label='Rata-rata Klinik', color=avg_color, markersize=8)
     ax.fill(angles, values, alpha=0.25, color=avg_color)
     
-    # Kustomisasi grid dan skala
-    ax.set_xticks(angles[:-1])
+    # Label dimensi
     ax.set_xticklabels(categories, fontsize=11)
     
-    # Set skala radial (0-5)
-    ax.set_ylim(0, 5)
-    ax.set_yticks([1, 2, 3, 4, 5])
-    ax.set_yticklabels(['1', '2', '3', '4', '5'], fontsize=10)
-    ax.grid(True, alpha=0.3)
-    
     # Tambahkan nilai pada setiap titik
     for angle, value, category in zip(angles[:-1], values[:-1], categories):
         ax.text(angle, value + 0.15, f'{value:.2f}', 
@@ -100,11 +125,9 @@ def create_spider_chart(data: Dict[str, float], save_path: str = 'digital_maturi
                         edgecolor=COLORS['neutral'], alpha=0.7))
     
     # Simpan figure
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
     
-    plt.tight_layout()
-    plt.show()
+    show_figure(fig)
 
 def create_comparison_ready_spider_chart(data: Dict[str, float], save_path: str = 'digital_maturity_spider_comparison_ready') -> None:
     """
@@ -115,20 +138,8 @@ def create_comparison_ready_spider_chart(data: Dict[str, float], save_path: str
         data: Dictionary dengan dimensi dan nilai rata-rata
         save_path: Path untuk menyimpan figure
     """
-    # Persiapan data
     categories = list(data.keys())
-    values = list(data.values())
-    
-    # Tambahkan nilai pertama di akhir untuk menutup polygon
-    values += values[:1]
-    
-    # Hitung sudut untuk setiap kategori
-    N = len(categories)
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]
-    
-    # Buat figure dan axis
-    fig, ax = plt.subplots(figsize=(12, 10), subplot_kw=dict(projection='polar'))
+    fig, ax, angles, values = _build_spider(data, figsize=(12, 10), tick_fontsize=11)
     
     # Warna konsisten untuk rata-rata (untuk perbandingan)
     avg_color = '#2E86AB'  # Biru yang konsisten
@@ -138,9 +149,6 @@ def create_comparison_ready_spider_chart(data: Dict[str, float], save_path: str
            color=avg_color, markersize=10, markerfacecolor=avg_color, markeredgecolor='white', markeredgewidth=2)
     ax.fill(angles, values, alpha=0.2, color=avg_color)
     
-    # Kustomisasi grid dan skala
-    ax.set_xticks(angles[:-1])
-    
     # Buat label yang lebih pendek untuk readability
     short_labels = [
         'Tata Kelola &\nKepemimpinan',
@@ -153,12 +161,6 @@ def create_comparison_ready_spider_chart(data: Dict[str, float], save_path: str
     ]
     ax.set_xticklabels(short_labels, fontsize=11)
     
-    # Set skala radial (0-5)
-    ax.set_ylim(0, 5)
-    ax.set_yticks([1, 2, 3, 4, 5])
-    ax.set_yticklabels(['1', '2', '3', '4', '5'], fontsize=11)
-    ax.grid(True, alpha=0.3)
-    
     # Tambahkan garis referensi untuk nilai rata-rata keseluruhan
     avg_overall = np.mean(values[:-1])
     ax.axhline(y=avg_overall, color=avg_color, linestyle='--', alpha=0.5, linewidth=1)
@@ -191,11 +193,9 @@ def create_comparison_ready_spider_chart(data: Dict[str, float], save_path: str
                         edgecolor=COLORS['neutral'], alpha=0.7))
     
     # Simpan figure
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
     
-    plt.tight_layout()
-    plt.show()
+    show_figure(fig)
 
 def print_summary_statistics(data: Dict[str, float]) -> None:
     """
@@ -204,8 +204,10 @@ def print_summary_statistics(data: Dict[str, float]) -> None:
     Args:
         data: Dictionary dengan dimensi dan nilai rata-rata
     """
-    values = list(data.values())
+    values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
     categories = list(data.keys())
+    i_max = int(values.argmax())
+    i_min = int(values.argmin())
     
     print("\n" + "="*75)
     print("STATISTIK TINGKAT KEMATANGAN DIGITAL KLINIK DI KABUPATEN PONOROGO")
@@ -220,14 +222,14 @@ def print_summary_statistics(data: Dict[str, float]) -> None:
     print("-"*75)
     
     # Statistik deskriptif
-    avg_value = np.mean(values)
-    max_value = max(values)
-    min_value = min(values)
-    std_value = np.std(values)
+    avg_value = values.mean()
+    max_value = values[i_max]
+    min_value = values[i_min]
+    std_value = values.std()
     
     print(f"{'Rata-rata Keseluruhan':35}: {avg_value:.2f}/5.00 ({avg_value/5*100:5.1f}%)")
-    print(f"{'Nilai Tertinggi':35}: {max_value:.2f}/5.00 ({categories[values.index(max_value)]})")
-    print(f"{'Nilai Terendah':35}: {min_value:.2f}/5.00 ({categories[values.index(min_value)]})")
+    print(f"{'Nilai Tertinggi':35}: {max_value:.2f}/5.00 ({categories[i_max]})")
+    print(f"{'Nilai Terendah':35}: {min_value:.2f}/5.00 ({categories[i_min]})")
     print(f"{'Standar Deviasi':35}: {std_value:.2f}")
     print(f"{'Rentang Nilai':35}: {max_value - min_value:.2f}")
     
@@ -235,8 +237,8 @@ def print_summary_statistics(data: Dict[str, float]) -> None:
     
     # Analisis dan wawasan
     print("\nWAWASAN KUNCI:")
-    print(f"• Dimensi dengan kematangan tertinggi: {categories[values.index(max_value)]} ({max_value:.2f}/5.00)")
-    print(f"• Dimensi dengan kematangan terendah: {categories[values.index(min_value)]} ({min_value:.2f}/5.00)")
+    print(f"• Dimensi dengan kematangan tertinggi: {categories[i_max]} ({max_value:.2f}/5.00)")
+    print(f"• Dimensi dengan kematangan terendah: {categories[i_min]} ({min_value:.2f}/5.00)")
     print(f"• Gap antara tertinggi dan terendah: {max_value - min_value:.2f} poin")
     
     # Kategori berdasarkan nilai
@@ -257,9 +259,12 @@ def print_summary_statistics(data: Dict[str, float]) -> None:
     
     print(f"• Tingkat kematangan digital keseluruhan: {maturity_level} ({avg_value:.2f}/5.00)")
 
-def main() -> None:
+def main(force: bool = False) -> None:
     """
     Fungsi utama untuk menjalankan semua visualisasi dan analisis.
+    
+    Args:
+        force: Render ulang chart meskipun output-nya masih terbaru
     """
     apply_style()
     data = get_digital_maturity_data()
@@ -268,12 +273,20 @@ def main() -> None:
     print_summary_statistics(data)
     
     print("\nMembuat visualisasi...")
-    
     print("\n1. Membuat spider chart standar...")
-    create_spider_chart(data)
-    
-    print("\n2. Membuat spider chart siap perbandingan...")
-    create_comparison_ready_spider_chart(data)
+    print("2. Membuat spider chart siap perbandingan...")
+    
+    # Kedua chart independen, jadi dirender paralel di proses terpisah;
+    # chart yang output-nya masih sesuai data dan kode saat ini dilewati
+    render_charts(
+        [
+            (create_spider_chart, 'digital_maturity_spider'),
+            (create_comparison_ready_spider_chart, 'digital_maturity_spider_comparison_ready'),
+        ],
+        (data,),
+        data_signature(data, __file__),
+        force=force,
+    )
     
     print("\n✅ Semua visualisasi berhasil dibuat!")
     print("\nFile yang dihasilkan di direktori 'output/':")
@@ -285,4 +298,17 @@ def main() -> None:
     print("• File 'comparison_ready' dirancang khusus untuk overlay dengan data tambahan")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Membuat spider chart kematangan digital")
+    parser.add_argument("--profile", action="store_true",
+                        help="Jalankan main() dengan cProfile, diurutkan berdasarkan waktu kumulatif")
+    parser.add_argument("--force", action="store_true",
+                        help="Render ulang figure meskipun output-nya masih terbaru")
+    args = parser.parse_args()
+
+    if args.profile:
+        import cProfile
+        cProfile.run('main(force=args.force)', sort='cumulative')
+    else:
+        main(force=args.force)
@@ -0,0 +1,160 @@
+"""
+Renderer Distribusi Klinik Dua Kategori
+=======================================
+
+Modul bersama untuk script distribusi klinik yang hanya berbeda pada data,
+nama kolom status, dan judul chart (layanan kecantikan, layanan rawat inap).
+"""
+
+import matplotlib.pyplot as plt
+from typing import Callable, Dict, Optional
+from style_guide import (
+    INTERACTIVE,
+    apply_style,
+    save_figure,
+    show_figure,
+    prepare_figure,
+    get_color_palette,
+    configure_bar_plot,
+    configure_pie_plot,
+    add_value_labels,
+    CategoryCounts,
+    BOX_STYLES,
+    COLORS
+)
+
+def create_bar_chart(prepared: CategoryCounts, status_col: str, title: str, save_path: str, fig=None) -> None:
+    owns_fig = fig is None
+    fig, ax = prepare_figure((10, 6), fig)
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.bar(prepared.labels, prepared.counts, color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
+    configure_bar_plot(
+        ax,
+        title,
+        status_col,
+        'Jumlah Klinik'
+    )
+    add_value_labels(ax, bars, list(prepared.counts))
+    for i, (bar, count, pct) in enumerate(zip(bars, prepared.counts, prepared.percentages)):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height/2,
+                f'{pct:.1f}%',
+                ha='center', va='center',
+                fontsize=11, fontweight='bold',
+                color='white')
+    ax.set_ylim(0, max(prepared.counts) * 1.1)
+    total = prepared.total
+    ax.text(0.98, 0.98, f'Total Klinik: {total}',
+            transform=ax.transAxes,
+            ha='right', va='top',
+            bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
+            fontsize=10)
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    if owns_fig:
+        show_figure(fig)
+
+def create_pie_chart(prepared: CategoryCounts, status_col: str, title: str, save_path: str, fig=None) -> None:
+    owns_fig = fig is None
+    fig, ax = prepare_figure((8, 8), fig)
+    colors = get_color_palette(len(prepared.labels))
+    labels = [f'{status}\n({jumlah} klinik, {pct:.1f}%)' for status, jumlah, pct in zip(prepared.labels, prepared.counts, prepared.percentages)]
+    pie_result = ax.pie(
+        prepared.counts,
+        labels=labels,
+        colors=colors,
+        autopct='',
+        startangle=90,
+        explode=(0.05, 0),
+        shadow=True,
+        textprops={'fontsize': 11}
+    )
+    if len(pie_result) == 3:
+        wedges, texts, autotexts = pie_result
+    else:
+        wedges, texts = pie_result
+        autotexts = []
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+        autotext.set_fontsize(12)
+    configure_pie_plot(ax, title)
+    total = prepared.total
+    ax.text(0, -1.3, f'Total Klinik: {total}',
+            ha='center', va='center',
+            bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.9),
+            fontsize=12, fontweight='bold')
+    ax.set_aspect('equal')
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    if owns_fig:
+        show_figure(fig)
+
+def create_horizontal_bar_chart(prepared: CategoryCounts, status_col: str, title: str, save_path: str, fig=None) -> None:
+    owns_fig = fig is None
+    fig, ax = prepare_figure((10, 6), fig)
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.barh(prepared.labels, prepared.counts, color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
+    ax.set_title(title, fontweight='bold', pad=20, fontsize=14)
+    ax.set_xlabel('Jumlah Klinik', fontsize=12)
+    ax.set_ylabel(status_col, fontsize=12)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    for i, (bar, count, pct) in enumerate(zip(bars, prepared.counts, prepared.percentages)):
+        width = bar.get_width()
+        ax.text(width + width*0.02, bar.get_y() + bar.get_height()/2,
+                f'{count} ({pct:.1f}%)',
+                ha='left', va='center',
+                fontsize=11, fontweight='bold',
+                color=COLORS['dark_gray'])
+    ax.set_xlim(0, max(prepared.counts) * 1.15)
+    total = prepared.total
+    ax.text(0.98, 0.02, f'Total Klinik: {total}',
+            transform=ax.transAxes,
+            ha='right', va='bottom',
+            bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
+            fontsize=10)
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    if owns_fig:
+        show_figure(fig)
+
+def print_summary_statistics(prepared: CategoryCounts, heading: str,
+                             label_width: int = 20, rule_width: int = 50,
+                             ratio_insight: Optional[Callable[[Dict[str, int]], str]] = None) -> None:
+    # ratio_insight menerima {status: jumlah} dan mengembalikan baris wawasan rasio,
+    # karena arah rasio (mana pembilang/penyebut) berbeda antar script
+    total = prepared.total
+    print("\n" + "="*rule_width)
+    print(heading)
+    print("="*rule_width)
+    for status, count, percentage in zip(prepared.labels, prepared.counts, prepared.percentages):
+        print(f"{status:{label_width}}: {count:3d} klinik ({percentage:5.1f}%)")
+    print("-"*rule_width)
+    print(f"{'Total':{label_width}}: {total:3d} klinik (100.0%)")
+    print("="*rule_width)
+    print("\nWAWASAN KUNCI:")
+    # prepare_counts() mengurutkan menurun, jadi status mayoritas ada di urutan pertama
+    primary_status = prepared.labels[0]
+    primary_percentage = prepared.percentages[0]
+    print(f"• Klinik dengan status '{primary_status}' merupakan mayoritas dengan {primary_percentage:.1f}% dari total klinik")
+    if ratio_insight is not None:
+        print(f"• {ratio_insight(dict(zip(prepared.labels, prepared.counts)))}")
+
+def render_all(prepared: CategoryCounts, status_col: str, output_slug: str, title: str) -> None:
+    # apply_style() hanya berjalan sekali per proses, jadi aman dipanggil dari sini
+    apply_style()
+    print("\nMembuat visualisasi...")
+    # Ketiga chart digambar bergantian pada satu figure yang dibersihkan di antaranya;
+    # mode interaktif memakai figure terpisah agar setiap chart tampil di jendelanya sendiri
+    fig = None if INTERACTIVE else plt.figure()
+    print("\n1. Membuat diagram batang...")
+    create_bar_chart(prepared, status_col, title, f'{output_slug}_bar', fig=fig)
+    print("\n2. Membuat diagram lingkaran...")
+    create_pie_chart(prepared, status_col, title, f'{output_slug}_pie', fig=fig)
+    print("\n3. Membuat diagram batang horizontal...")
+    create_horizontal_bar_chart(prepared, status_col, title, f'{output_slug}_horizontal', fig=fig)
+    if fig is not None:
+        plt.close(fig)
+    print("\n✅ Semua visualisasi berhasil dibuat!")
+    print("\nFile yang dihasilkan di direktori 'output/':")
+    print(f"• {output_slug}_bar.png/.svg")
+    print(f"• {output_slug}_pie.png/.svg")
+    print(f"• {output_slug}_horizontal.png/.svg")
@@ -0,0 +1,447 @@
+"""
+Spider Chart Perbandingan Tingkat Kematangan Digital: Rata-rata vs Klinik Terbaik/Terendah
+=========================================================================================
+
+Script ini menghasilkan visualisasi spider chart (radar chart) untuk membandingkan
+rata-rata tingkat kematangan digital klinik dengan klinik dengan tingkat kematangan
+digital tertinggi (mode 'best') atau terendah (mode 'poor') di Kabupaten Ponorogo
+dari 7 dimensi dengan skala 5.
+
+Penggunaan:
+    python dmi_spider_chart_comparison.py          # kedua perbandingan
+    python dmi_spider_chart_comparison.py best     # rata-rata vs klinik terbaik
+    python dmi_spider_chart_comparison.py poor     # rata-rata vs klinik terendah
+"""
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.patches import Polygon
+from typing import Dict, Literal, NamedTuple, Optional, Tuple
+from style_guide import (
+    apply_style,
+    save_figure,
+    show_figure,
+    BOX_STYLES,
+    COLORS
+)
+
+# =============================================================================
+# DATA
+# =============================================================================
+
+DIMENSIONS: Tuple[str, ...] = (
+    'Tata Kelola & Kepemimpinan',
+    'Manusia, Keterampilan & Perilaku',
+    'Perawatan Berpusat pada Pasien',
+    'Strategi',
+    'Analisis Data',
+    'Kapabilitas TI',
+    'Interoperabilitas',
+)
+
+# Label yang lebih pendek untuk readability, urutan sama dengan DIMENSIONS
+SHORT_LABELS: Tuple[str, ...] = (
+    'Tata Kelola &\nKepemimpinan',
+    'Manusia, Keterampilan\n& Perilaku',
+    'Perawatan Berpusat\npada Pasien',
+    'Strategi',
+    'Analisis Data',
+    'Kapabilitas TI',
+    'Interoperabilitas',
+)
+
+# Sudut tiap dimensi pada spider chart; titik terakhir (2π) menutup polygon
+_ANGLES = np.linspace(0, 2 * np.pi, len(DIMENSIONS) + 1)
+
+AVG_SCORES: Tuple[float, ...] = (4.21, 4.18, 4.06, 4.03, 4.01, 3.88, 3.83)
+TOP_SCORES: Tuple[float, ...] = (5.00, 4.92, 5.00, 5.00, 5.00, 5.00, 5.00)
+POOR_SCORES: Tuple[float, ...] = (2.58, 2.83, 3.00, 3.00, 3.00, 2.69, 2.20)
+
+def get_average_digital_maturity_data() -> Dict[str, float]:
+    """
+    Data rata-rata tingkat kematangan digital klinik dari 7 dimensi.
+    """
+    return dict(zip(DIMENSIONS, AVG_SCORES))
+
+def get_top_clinic_data() -> Dict[str, float]:
+    """
+    Data tingkat kematangan digital klinik terbaik (Klinik A) dari 7 dimensi.
+    """
+    return dict(zip(DIMENSIONS, TOP_SCORES))
+
+def get_poor_clinic_data() -> Dict[str, float]:
+    """
+    Data tingkat kematangan digital klinik terburuk (Klinik B) dari 7 dimensi.
+    """
+    return dict(zip(DIMENSIONS, POOR_SCORES))
+
+class ComparisonMode(NamedTuple):
+    """Pengaturan satu jenis perbandingan terhadap rata-rata."""
+    name: str                 # Nama klinik pembanding, mis. 'Terbaik'
+    legend_label: str         # Label legenda untuk klinik pembanding
+    color: str                # Warna seri klinik pembanding
+    label_offset: float       # Geser radial label nilai klinik pembanding
+    above_average: bool       # True jika pembanding berada di atas rata-rata
+    save_path: str            # Nama file output (tanpa ekstensi)
+
+MODES: Dict[str, ComparisonMode] = {
+    'best': ComparisonMode(
+        name='Terbaik',
+        legend_label='Klinik Terbaik (Klinik A)',
+        color='#3498DB',  # Warna biru profesional untuk klinik terbaik (dari style guide)
+        label_offset=0.35,
+        above_average=True,
+        save_path='digital_maturity_comparison_spider',
+    ),
+    'poor': ComparisonMode(
+        name='Terendah',
+        legend_label='Klinik Terendah (Klinik B)',
+        color=COLORS['warning'],  # Warna merah untuk klinik terburuk (dari style guide)
+        label_offset=-0.25,
+        above_average=False,
+        save_path='digital_maturity_avg_vs_poor_spider',
+    ),
+}
+
+_MODE_DATA = {
+    'best': get_top_clinic_data,
+    'poor': get_poor_clinic_data,
+}
+
+# =============================================================================
+# VISUALISASI
+# =============================================================================
+
+def _plot_series(ax, angles: np.ndarray, values: np.ndarray, color: str, marker: str) -> Line2D:
+    """
+    Menggambar satu seri spider chart: area dan garis tepi sebagai satu Polygon,
+    titik data sebagai satu scatter.
+
+    Args:
+        ax: Polar axes tujuan
+        angles: Sudut tiap dimensi (tanpa titik penutup)
+        values: Nilai tiap dimensi (tanpa titik penutup)
+        color: Warna seri
+        marker: Marker titik data, mis. 'o' atau 's'
+
+    Returns:
+        Handle legenda (garis + marker) yang tidak ikut digambar di axes
+    """
+    polygon = Polygon(np.column_stack([angles, values]), closed=True,
+                      facecolor=to_rgba(color, 0.15), edgecolor=color, linewidth=3)
+    ax.add_patch(polygon)
+    # zorder di atas polygon seri lain, di bawah label nilai
+    ax.scatter(angles, values, s=8 ** 2, marker=marker, c=color,
+               edgecolors='white', linewidths=2, zorder=2.5)
+    return Line2D([], [], color=color, linewidth=3, marker=marker, markersize=8,
+                  markerfacecolor=color, markeredgecolor='white', markeredgewidth=2)
+
+def create_comparison_spider_chart(
+    avg_data: Dict[str, float],
+    other_data: Dict[str, float],
+    mode: ComparisonMode,
+    save_path: Optional[str] = None
+) -> None:
+    """
+    Membuat spider chart perbandingan antara rata-rata dan klinik pembanding.
+
+    Args:
+        avg_data: Dictionary dengan dimensi dan nilai rata-rata
+        other_data: Dictionary dengan dimensi dan nilai klinik pembanding
+        mode: Pengaturan perbandingan (lihat MODES)
+        save_path: Path untuk menyimpan figure (default: mode.save_path)
+    """
+    if save_path is None:
+        save_path = mode.save_path
+
+    # Persiapan data
+    N = len(avg_data)
+    avg_arr = np.fromiter(avg_data.values(), dtype=np.float64, count=N)
+    other_arr = np.fromiter(other_data.values(), dtype=np.float64, count=N)
+
+    # Sudut untuk setiap kategori (dihitung sekali di level modul untuk 7 dimensi)
+    angles = _ANGLES if N == len(DIMENSIONS) else np.linspace(0, 2 * np.pi, N + 1)
+
+    # Buat figure dan axis
+    fig, ax = plt.subplots(figsize=(12, 12), subplot_kw=dict(projection='polar'))
+
+    # Warna konsisten: rata-rata menggunakan warna primary yang sama seperti chart lain
+    avg_color = COLORS['primary']  # Konsisten dengan chart rata-rata lainnya
+    other_color = mode.color
+
+    # Plot data rata-rata dan klinik pembanding
+    avg_handle = _plot_series(ax, angles[:-1], avg_arr, avg_color, 'o')
+    other_handle = _plot_series(ax, angles[:-1], other_arr, other_color, 's')
+
+    # Kustomisasi grid dan skala
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(SHORT_LABELS, fontsize=11)
+
+    # Set skala radial (0-5)
+    ax.set_ylim(0, 5)
+    ax.set_yticks([1, 2, 3, 4, 5])
+    ax.set_yticklabels(['1', '2', '3', '4', '5'], fontsize=10)
+    ax.grid(True, alpha=0.3)
+
+    # Tambahkan garis referensi untuk nilai rata-rata keseluruhan
+    avg_overall = float(avg_arr.mean())
+    other_overall = float(other_arr.mean())
+    ax.axhline(y=avg_overall, color=avg_color, linestyle='--', alpha=0.5, linewidth=1)
+    ax.axhline(y=other_overall, color=other_color, linestyle='--', alpha=0.5, linewidth=1)
+
+    # Tambahkan nilai pada setiap titik untuk rata-rata
+    # Posisi label dan teksnya dihitung sekaligus untuk semua dimensi
+    avg_label_y = avg_arr + 0.2
+    other_label_y = other_arr + mode.label_offset
+    avg_labels = np.char.mod('%.2f', avg_arr)
+    other_labels = np.char.mod('%.2f', other_arr)
+
+    # Style kotak label dibuat sekali (ax.text menyalin dict ini untuk setiap label)
+    avg_bbox = dict(boxstyle=BOX_STYLES['label'], facecolor='white',
+                    edgecolor=avg_color, alpha=0.9)
+    other_bbox = dict(boxstyle=BOX_STYLES['label'], facecolor='white',
+                      edgecolor=other_color, alpha=0.9)
+
+    for angle, avg_y, avg_label, other_y, other_label in zip(angles[:-1], avg_label_y, avg_labels, other_label_y, other_labels):
+        # Nilai rata-rata
+        ax.text(angle, avg_y, avg_label,
+               horizontalalignment='center',
+               verticalalignment='center',
+               fontsize=10, fontweight='bold',
+               bbox=avg_bbox)
+
+        # Nilai klinik pembanding
+        ax.text(angle, other_y, other_label,
+               horizontalalignment='center',
+               verticalalignment='center',
+               fontsize=10, fontweight='bold',
+               bbox=other_bbox)
+
+    # Kustomisasi tampilan
+    ax.set_title(f'Perbandingan Tingkat Kematangan Digital:\nRata-rata vs Klinik {mode.name} di Kabupaten Ponorogo',
+                size=16, fontweight='bold', pad=40)
+
+    # Tambahkan legenda
+    ax.legend([avg_handle, other_handle], ['Rata-rata Klinik Ponorogo', mode.legend_label],
+              loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=12)
+
+    # Tambahkan informasi statistik
+    plt.figtext(0.02, 0.08, f'Rata-rata Keseluruhan: {avg_overall:.2f}/5.00',
+               fontsize=12, fontweight='bold',
+               bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'],
+                        edgecolor=avg_color, alpha=0.9))
+
+    plt.figtext(0.02, 0.05, f'Klinik {mode.name}: {other_overall:.2f}/5.00',
+               fontsize=12, fontweight='bold',
+               bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'],
+                        edgecolor=other_color, alpha=0.9))
+
+    # Hitung selisih rata-rata (selalu positif: yang lebih tinggi dikurangi yang lebih rendah)
+    gap = other_overall - avg_overall if mode.above_average else avg_overall - other_overall
+    plt.figtext(0.02, 0.02, f'Selisih: {gap:.2f} | Skala: 1-5',
+               fontsize=10,
+               bbox=dict(boxstyle=BOX_STYLES['note'], facecolor=COLORS['light_gray'],
+                        edgecolor=COLORS['neutral'], alpha=0.7))
+
+    # Simpan figure
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+
+    show_figure(fig)
+
+def create_detailed_comparison_table(
+    avg_data: Dict[str, float],
+    other_data: Dict[str, float],
+    mode: ComparisonMode
+) -> pd.DataFrame:
+    """
+    Membuat tabel perbandingan detail antara rata-rata dan klinik pembanding.
+
+    Args:
+        avg_data: Dictionary dengan dimensi dan nilai rata-rata
+        other_data: Dictionary dengan dimensi dan nilai klinik pembanding
+        mode: Pengaturan perbandingan (lihat MODES)
+
+    Returns:
+        DataFrame dengan perbandingan detail
+    """
+    # Hitung dengan array NumPy; DataFrame hanya dibuat sekali di akhir untuk tampilan
+    n = len(avg_data)
+    avg = np.fromiter(avg_data.values(), dtype=np.float64, count=n)
+    other = np.fromiter(other_data.values(), dtype=np.float64, count=n)
+
+    # Selisih dihitung dari yang lebih tinggi ke yang lebih rendah,
+    # persentasenya relatif terhadap nilai yang lebih rendah
+    high, low = (other, avg) if mode.above_average else (avg, other)
+    diff = high - low
+    diff_pct = np.round(diff / low * 100, 2)
+
+    # Urutkan berdasarkan selisih terbesar (stabil: dimensi dengan selisih sama tetap berurutan)
+    order = np.argsort(-diff, kind='stable')
+
+    return pd.DataFrame({
+        'Dimensi': np.array(list(avg_data), dtype=object)[order],
+        'Rata-rata': avg[order],
+        f'Klinik {mode.name}': other[order],
+        'Selisih': diff[order],
+        'Selisih (%)': diff_pct[order],
+    })
+
+def _summary_reductions(
+    avg: np.ndarray,
+    other: np.ndarray,
+    above_average: bool
+) -> Tuple[float, float, np.ndarray, int, int, int, int]:
+    """
+    Menghitung semua reduksi untuk ringkasan sekaligus dari dua array nilai.
+
+    Args:
+        avg: Nilai rata-rata per dimensi
+        other: Nilai klinik pembanding per dimensi
+        above_average: True jika pembanding berada di atas rata-rata
+
+    Returns:
+        Tuple (rata-rata avg, rata-rata pembanding, selisih per dimensi, indeks gap
+        terbesar, indeks gap terkecil, jumlah skor 5.0 avg, jumlah skor 5.0 pembanding)
+    """
+    gap = other - avg if above_average else avg - other
+    return (
+        float(avg.mean()),
+        float(other.mean()),
+        gap,
+        int(gap.argmax()),
+        int(gap.argmin()),
+        int(np.count_nonzero(avg == 5.0)),
+        int(np.count_nonzero(other == 5.0)),
+    )
+
+def print_summary_statistics(
+    avg_data: Dict[str, float],
+    other_data: Dict[str, float],
+    mode: ComparisonMode,
+    df: Optional[pd.DataFrame] = None
+) -> None:
+    """
+    Mencetak statistik ringkasan untuk perbandingan data kematangan digital.
+
+    Args:
+        avg_data: Dictionary dengan dimensi dan nilai rata-rata
+        other_data: Dictionary dengan dimensi dan nilai klinik pembanding
+        mode: Pengaturan perbandingan (lihat MODES)
+        df: Tabel dari create_detailed_comparison_table() jika sudah dibuat
+    """
+    dimensions = list(avg_data.keys())
+    n = len(dimensions)
+    other_col = f'Klinik {mode.name}'
+
+    (avg_overall, other_overall, gap, max_gap_idx, min_gap_idx,
+     perfect_avg_dims, perfect_other_dims) = _summary_reductions(
+        np.fromiter(avg_data.values(), dtype=np.float64, count=n),
+        np.fromiter(other_data.values(), dtype=np.float64, count=n),
+        mode.above_average,
+    )
+    if mode.above_average:
+        high_overall, low_overall = other_overall, avg_overall
+    else:
+        high_overall, low_overall = avg_overall, other_overall
+
+    print("\n" + "="*80)
+    print(f"PERBANDINGAN TINGKAT KEMATANGAN DIGITAL: RATA-RATA VS {other_col.upper()}")
+    print("="*80)
+
+    # Tabel perbandingan
+    if df is None:
+        df = create_detailed_comparison_table(avg_data, other_data, mode)
+    print("\nPERBANDINGAN PER DIMENSI:")
+    print("-"*80)
+    print(f"{'Dimensi':<30} {'Rata-rata':<10} {mode.name:<10} {'Selisih':<10} {'Selisih %':<10}")
+    print("-"*80)
+
+    for dim, avg_v, other_v, diff, diff_pct in zip(df['Dimensi'].to_numpy(), df['Rata-rata'].to_numpy(),
+                                                  df[other_col].to_numpy(), df['Selisih'].to_numpy(),
+                                                  df['Selisih (%)'].to_numpy()):
+        print(f"{dim:<30} {avg_v:<10.2f} {other_v:<10.2f} "
+              f"{diff:<10.2f} {diff_pct:<10.1f}%")
+
+    print("-"*80)
+    print(f"{'RATA-RATA KESELURUHAN':<30} {avg_overall:<10.2f} {other_overall:<10.2f} "
+          f"{high_overall - low_overall:<10.2f} {((high_overall - low_overall) / low_overall * 100):<10.1f}%")
+    print("="*80)
+
+    print("\nWAWASAN KUNCI:")
+    # Dimensi dengan gap terbesar dan terkecil (seri: dimensi pertama)
+    print(f"• Gap terbesar pada dimensi '{dimensions[max_gap_idx]}': {gap[max_gap_idx]:.2f} poin")
+    print(f"• Gap terkecil pada dimensi '{dimensions[min_gap_idx]}': {gap[min_gap_idx]:.2f} poin")
+
+    # Kinerja klinik rata-rata (hanya relevan jika pembanding di bawah rata-rata)
+    if not mode.above_average:
+        print(f"• Klinik rata-rata mencapai skor maksimal (5.0) pada {perfect_avg_dims} dari {n} dimensi")
+    # Kinerja klinik pembanding
+    print(f"• {other_col.capitalize()} mencapai skor maksimal (5.0) pada {perfect_other_dims} dari {n} dimensi")
+
+    # Potensi peningkatan rata-rata
+    improvement_potential_avg = 5.0 - avg_overall
+    print(f"• Potensi peningkatan rata-rata: {improvement_potential_avg:.2f} poin ({improvement_potential_avg/5*100:.1f}%)")
+    # Potensi peningkatan klinik terendah
+    if not mode.above_average:
+        improvement_potential_other = 5.0 - other_overall
+        print(f"• Potensi peningkatan {other_col.lower()}: {improvement_potential_other:.2f} poin ({improvement_potential_other/5*100:.1f}%)")
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def run_comparison(mode_key: Literal['best', 'poor']) -> None:
+    """
+    Menjalankan statistik, visualisasi, dan tabel untuk satu jenis perbandingan.
+
+    Args:
+        mode_key: 'best' (rata-rata vs klinik terbaik) atau 'poor' (rata-rata vs klinik terendah)
+    """
+    mode = MODES[mode_key]
+
+    # Ambil data
+    avg_data = get_average_digital_maturity_data()
+    other_data = _MODE_DATA[mode_key]()
+
+    # Tabel perbandingan dibuat sekali, dipakai untuk ringkasan dan tabel detail
+    df_comparison = create_detailed_comparison_table(avg_data, other_data, mode)
+
+    # Cetak statistik ringkasan
+    print_summary_statistics(avg_data, other_data, mode, df_comparison)
+
+    print("\nMembuat visualisasi perbandingan...")
+    print("\n1. Membuat spider chart perbandingan...")
+    create_comparison_spider_chart(avg_data, other_data, mode)
+
+    print("\n✅ Visualisasi berhasil dibuat!")
+    print("\nFile yang dihasilkan di direktori 'output/':")
+    print(f"• {mode.save_path}.png/.svg")
+
+    # Tampilkan tabel perbandingan
+    print(f"\nTabel perbandingan detail:")
+    print(df_comparison.to_string(index=False))
+
+def main(mode: Optional[Literal['best', 'poor']] = None) -> None:
+    """
+    Fungsi utama untuk menjalankan semua visualisasi dan analisis.
+
+    Args:
+        mode: 'best' atau 'poor'; None menjalankan kedua perbandingan
+    """
+    # Terapkan style guide (sekali untuk semua perbandingan)
+    apply_style()
+
+    for mode_key in (mode,) if mode else tuple(MODES):
+        run_comparison(mode_key)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Membuat spider chart perbandingan kematangan digital")
+    parser.add_argument("mode", nargs="?", choices=tuple(MODES),
+                        help="Jenis perbandingan; tanpa argumen menjalankan keduanya")
+    args = parser.parse_args()
+
+    main(args.mode)
@@ -7,15 +7,21 @@ Script ini menghasilkan visualisasi distribusi klinik berdasarkan durasi impleme
 
 import matplotlib.pyplot as plt
 import pandas as pd
-from typing import Dict
+from matplotlib.patheffects import withSimplePatchShadow
+from functools import lru_cache
+from typing import Dict, Tuple
 from style_guide import (
+    INTERACTIVE,
     apply_style,
     save_figure,
+    show_figure,
+    prepare_figure,
     get_color_palette,
     configure_bar_plot,
     configure_pie_plot,
     add_value_labels,
     format_percentage_labels,
+    BOX_STYLES,
     COLORS
 )
 
@@ -30,16 +36,19 @@ def get_durasi_data() -> Dict[str, int]:
     }
 
 def create_dataframe(data: Dict[str, int]) -> pd.DataFrame:
-    df = pd.DataFrame(list(data.items()), columns=pd.Index(['Durasi Implementasi SIK', 'Jumlah Klinik']))
+    # DataFrame yang sama dipakai bersama oleh semua chart; jangan diubah di tempat
+    return _cached_dataframe(tuple(data.items()))
+
+@lru_cache(maxsize=8)
+def _cached_dataframe(items: Tuple[Tuple[str, int], ...]) -> pd.DataFrame:
+    df = pd.DataFrame(list(items), columns=pd.Index(['Durasi Implementasi SIK', 'Jumlah Klinik']))
     df['Persentase'] = (df['Jumlah Klinik'] / df['Jumlah Klinik'].sum()) * 100
     # Sort by 'Jumlah Klinik' descending for better chart readability
     df = df.sort_values('Jumlah Klinik', ascending=False).reset_index(drop=True)
     return df
 
-def create_bar_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi_sik_bar') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(10, 6))
-    colors = get_color_palette(len(data))
+def _draw_bar(ax, df: pd.DataFrame) -> None:
+    colors = get_color_palette(len(df))
     bars = ax.bar(df['Durasi Implementasi SIK'], df['Jumlah Klinik'], color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
     configure_bar_plot(
         ax,
@@ -60,27 +69,24 @@ def create_bar_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi
     ax.text(0.98, 0.98, f'Total Klinik: {total}',
             transform=ax.transAxes,
             ha='right', va='top',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
+            bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
             fontsize=10)
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
 
-def create_pie_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi_sik_pie') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(8, 8))
-    colors = get_color_palette(len(data))
-    percentages = format_percentage_labels(df['Jumlah Klinik'].tolist())
-    labels = [f'{durasi}\n({jumlah} klinik, {pct})' for durasi, jumlah, pct in zip(df['Durasi Implementasi SIK'], df['Jumlah Klinik'], percentages)]
+def _draw_pie(ax, df: pd.DataFrame) -> None:
+    # Kategori bernilai 0 tidak punya wedge, jadi dilewati (tetap ada di statistik dan diagram batang);
+    # df terurut menurun sehingga kategori 0 ada di akhir dan warna kategori lain tidak bergeser
+    df_plot = df[df['Jumlah Klinik'] > 0]
+    colors = get_color_palette(len(df))[:len(df_plot)]
+    percentages = format_percentage_labels(df_plot['Jumlah Klinik'].tolist())
+    labels = [f'{durasi}\n({jumlah} klinik, {pct})' for durasi, jumlah, pct in zip(df_plot['Durasi Implementasi SIK'], df_plot['Jumlah Klinik'], percentages)]
     pie_result = ax.pie(
-        df['Jumlah Klinik'],
+        df_plot['Jumlah Klinik'],
         labels=labels,
         colors=colors,
         autopct='',
         startangle=90,
-        explode=[0.05 if count > 0 else 0 for count in df['Jumlah Klinik']],
-        shadow=True,
+        explode=[0.05] * len(df_plot),
+        shadow=False,
         textprops={'fontsize': 11}
     )
     if len(pie_result) == 3:
@@ -88,6 +94,9 @@ def create_pie_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi
     else:
         wedges, texts = pie_result
         autotexts = []
+    # Bayangan digambar sebagai path effect, bukan salinan geometri wedge dari shadow=True
+    for wedge in wedges:
+        wedge.set_path_effects([withSimplePatchShadow(offset=(2, -2), alpha=0.3)])
     for autotext in autotexts:
         autotext.set_color('white')
         autotext.set_fontweight('bold')
@@ -96,18 +105,12 @@ def create_pie_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi
     total = df['Jumlah Klinik'].sum()
     ax.text(0, -1.3, f'Total Klinik: {total}',
             ha='center', va='center',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.9),
+            bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.9),
             fontsize=12, fontweight='bold')
     ax.set_aspect('equal')
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
 
-def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi_sik_horizontal') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(10, 6))
-    colors = get_color_palette(len(data))
+def _draw_horizontal_bar(ax, df: pd.DataFrame) -> None:
+    colors = get_color_palette(len(df))
     bars = ax.barh(df['Durasi Implementasi SIK'], df['Jumlah Klinik'], color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
     ax.set_title('Distribusi Klinik Berdasarkan Durasi Implementasi SIK', fontweight='bold', pad=20, fontsize=14)
     ax.set_xlabel('Jumlah Klinik', fontsize=12)
@@ -126,12 +129,36 @@ def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'durasi_i
     ax.text(0.98, 0.02, f'Total Klinik: {total}',
             transform=ax.transAxes,
             ha='right', va='bottom',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
+            bbox=dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
             fontsize=10)
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
+
+def _create_chart(draw, figsize: Tuple[float, float], data: Dict[str, int], save_path: str, fig=None) -> None:
+    owns_fig = fig is None
+    fig, ax = prepare_figure(figsize, fig)
+    draw(ax, create_dataframe(data))
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    if owns_fig:
+        show_figure(fig)
+
+def create_bar_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi_sik_bar', fig=None) -> None:
+    _create_chart(_draw_bar, (10, 6), data, save_path, fig)
+
+def create_pie_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi_sik_pie', fig=None) -> None:
+    _create_chart(_draw_pie, (8, 8), data, save_path, fig)
+
+def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'durasi_implementasi_sik_horizontal', fig=None) -> None:
+    _create_chart(_draw_horizontal_bar, (10, 6), data, save_path, fig)
+
+def create_all_charts(data: Dict[str, int], save_path: str = 'durasi_implementasi_sik_overview') -> None:
+    # Ringkasan untuk laporan/dashboard: ketiga chart berdampingan dalam satu figure,
+    # digambar dalam satu kali render. File per chart tetap dibuat oleh create_*_chart.
+    df = create_dataframe(data)
+    fig, (ax_bar, ax_pie, ax_horizontal) = plt.subplots(1, 3, figsize=(26, 8))
+    _draw_bar(ax_bar, df)
+    _draw_pie(ax_pie, df)
+    _draw_horizontal_bar(ax_horizontal, df)
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    show_figure(fig)
 
 def print_summary_statistics(data: Dict[str, int]) -> None:
     df = create_dataframe(data)
@@ -139,10 +166,7 @@ def print_summary_statistics(data: Dict[str, int]) -> None:
     print("\n" + "="*50)
     print("STATISTIK DISTRIBUSI KLINIK BERDASARKAN DURASI IMPLEMENTASI SIK")
     print("="*50)
-    for _, row in df.iterrows():
-        durasi = row['Durasi Implementasi SIK']
-        count = row['Jumlah Klinik']
-        percentage = row['Persentase']
+    for durasi, count, percentage in zip(df['Durasi Implementasi SIK'].to_numpy(), df['Jumlah Klinik'].to_numpy(), df['Persentase'].to_numpy()):
         print(f"{durasi:15}: {count:3d} klinik ({percentage:5.1f}%)")
     print("-"*50)
     print(f"{'Total':15}: {total:3d} klinik (100.0%)")
@@ -157,22 +181,39 @@ def print_summary_statistics(data: Dict[str, int]) -> None:
         ratio = sorted_df.iloc[0]['Jumlah Klinik'] / sorted_df.iloc[1]['Jumlah Klinik']
         print(f"• Rasio {sorted_df.iloc[0]['Durasi Implementasi SIK']} terhadap {sorted_df.iloc[1]['Durasi Implementasi SIK']}: {ratio:.1f}:1")
 
-def main() -> None:
+def main(overview: bool = False) -> None:
     apply_style()
     data = get_durasi_data()
     print_summary_statistics(data)
     print("\nMembuat visualisasi...")
+    # Ketiga chart digambar bergantian pada satu figure yang dibersihkan di antaranya;
+    # mode interaktif memakai figure terpisah agar setiap chart tampil di jendelanya sendiri
+    fig = None if INTERACTIVE else plt.figure()
     print("\n1. Membuat diagram batang...")
-    create_bar_chart(data)
+    create_bar_chart(data, fig=fig)
     print("\n2. Membuat diagram lingkaran...")
-    create_pie_chart(data)
+    create_pie_chart(data, fig=fig)
     print("\n3. Membuat diagram batang horizontal...")
-    create_horizontal_bar_chart(data)
+    create_horizontal_bar_chart(data, fig=fig)
+    if fig is not None:
+        plt.close(fig)
+    if overview:
+        print("\n4. Membuat ringkasan tiga panel...")
+        create_all_charts(data)
     print("\n✅ Semua visualisasi berhasil dibuat!")
     print("\nFile yang dihasilkan di direktori 'output/':")
     print("• durasi_implementasi_sik_bar.png/.svg")
     print("• durasi_implementasi_sik_pie.png/.svg")
     print("• durasi_implementasi_sik_horizontal.png/.svg")
+    if overview:
+        print("• durasi_implementasi_sik_overview.png/.svg")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate SIK implementation duration distribution figures")
+    parser.add_argument("--overview", action="store_true",
+                        help="Also save the three charts side by side as one overview figure")
+    args = parser.parse_args()
+
+    main(overview=args.overview)
@@ -7,15 +7,31 @@ This script handles the installation of dependencies and provides
 an easy way to generate clinic distribution figures.
 
 Usage:
-    python install_and_run.py [--install-only] [--generate-only]
+    python install_and_run.py [--install-only] [--generate-only] [--check-deps]
 """
 
+import hashlib
+import importlib.util
 import subprocess
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
+USAGE = """usage: install_and_run.py [-h] [--install-only] [--generate-only] [--check-deps]
+
+Install dependencies and generate clinic figures
+
+options:
+  -h, --help       show this help message and exit
+  --install-only   Only install dependencies, don't generate figures
+  --generate-only  Only generate figures, skip dependency installation
+  --check-deps     Only check if dependencies are installed"""
+
+# Records the hash of the requirements.txt that was last installed successfully
+INSTALL_STAMP = Path(".install_stamp")
+
 def check_python_version() -> bool:
     """Check if Python version is compatible."""
     version = sys.version_info
@@ -26,25 +42,46 @@ def check_python_version() -> bool:
     print(f"✅ Python version {version.major}.{version.minor}.{version.micro} is compatible")
     return True
 
-def install_dependencies() -> bool:
-    """Install required dependencies."""
+def install_dependencies(force: bool = False) -> bool:
+    """
+    Install required dependencies.
+    
+    Args:
+        force: Run pip even if .install_stamp matches requirements.txt
+    """
     try:
         print("\n📦 Installing dependencies...")
         
-        # Check if requirements.txt exists
-        if not Path("requirements.txt").exists():
+        # Reading requirements.txt doubles as the existence check
+        try:
+            requirements_bytes = Path("requirements.txt").read_bytes()
+        except FileNotFoundError:
             print("❌ requirements.txt not found!")
             return False
         
-        # Install dependencies
-        result = subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ], capture_output=True, text=True)
+        # Skip pip entirely when these exact requirements were already installed
+        requirements_hash = hashlib.sha256(requirements_bytes).hexdigest()
+        if not force and INSTALL_STAMP.exists() and INSTALL_STAMP.read_text().strip() == requirements_hash:
+            print("✅ Dependencies already installed for the current requirements.txt")
+            return True
+        
+        # Install dependencies, preferring wheels over source builds, and
+        # forward pip's output as it arrives so progress stays visible
+        process = subprocess.Popen([
+            sys.executable, "-m", "pip", "install",
+            "--prefer-binary", "--no-input", "--disable-pip-version-check",
+            "-r", "requirements.txt"
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        for line in process.stdout:
+            print(f"   {line}", end="")
         
-        if result.returncode != 0:
-            print(f"❌ Failed to install dependencies: {result.stderr}")
+        returncode = process.wait()
+        if returncode != 0:
+            print(f"❌ Failed to install dependencies (pip exited with code {returncode})")
             return False
         
+        INSTALL_STAMP.write_text(requirements_hash)
+        check_dependencies.cache_clear()
         print("✅ Dependencies installed successfully!")
         return True
         
@@ -52,8 +89,14 @@ def install_dependencies() -> bool:
         print(f"❌ Error installing dependencies: {e}")
         return False
 
+@lru_cache(maxsize=1)
 def check_dependencies() -> bool:
-    """Check if all required dependencies are available."""
+    """
+    Check if all required dependencies are available.
+    
+    The result is cached for the process; call check_dependencies.cache_clear()
+    after installing packages so the next call scans again.
+    """
     required_packages = [
         'matplotlib',
         'seaborn', 
@@ -65,13 +108,14 @@ def check_dependencies() -> bool:
     
     missing_packages = []
     
+    # find_spec only locates each package; importing them just to test
+    # availability would run all of matplotlib/pandas/scipy's import-time code
     for package in required_packages:
-        try:
-            __import__(package)
-            print(f"✅ {package} is available")
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             missing_packages.append(package)
             print(f"❌ {package} is missing")
+        else:
+            print(f"✅ {package} is available")
     
     if missing_packages:
         print(f"\n❌ Missing packages: {', '.join(missing_packages)}")
@@ -114,29 +158,34 @@ def list_generated_files() -> None:
         print("❌ Output directory doesn't exist")
         return
     
-    files = list(output_dir.glob("*"))
+    # scandir entries carry the file type from the directory listing and
+    # cache their stat() result, so each file costs at most one stat call
+    with os.scandir(output_dir) as it:
+        files = sorted((entry for entry in it if entry.is_file()), key=lambda entry: entry.name)
     if not files:
         print("❌ No files found in output directory")
         return
     
     print("\n📁 Generated files:")
-    for file in sorted(files):
+    for file in files:
         size = file.stat().st_size / 1024  # Size in KB
         print(f"   • {file.name} ({size:.1f} KB)")
 
 def main() -> None:
     """Main installation and execution function."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Install dependencies and generate clinic figures")
-    parser.add_argument("--install-only", action="store_true", 
-                       help="Only install dependencies, don't generate figures")
-    parser.add_argument("--generate-only", action="store_true",
-                       help="Only generate figures, skip dependency installation")
-    parser.add_argument("--check-deps", action="store_true",
-                       help="Only check if dependencies are installed")
-    
-    args = parser.parse_args()
+    # Three boolean flags don't need argparse (and its import) on every run
+    flags = set(sys.argv[1:])
+    if flags & {"-h", "--help"}:
+        print(USAGE)
+        return
+    unknown = flags - {"--install-only", "--generate-only", "--check-deps"}
+    if unknown:
+        print(USAGE.splitlines()[0], file=sys.stderr)
+        print(f"install_and_run.py: error: unrecognized arguments: {' '.join(sorted(unknown))}", file=sys.stderr)
+        sys.exit(2)
+    install_only = "--install-only" in flags
+    generate_only = "--generate-only" in flags
+    check_deps = "--check-deps" in flags
     
     print("🔬 Research Paper Figure Generator Setup")
     print("=" * 50)
@@ -149,14 +198,14 @@ def main() -> None:
     create_output_directory()
     
     # Handle different modes
-    if args.check_deps:
+    if check_deps:
         if check_dependencies():
             print("\n✅ All dependencies are ready!")
         else:
             print("\n❌ Some dependencies are missing. Run without --check-deps to install them.")
         return
     
-    if args.generate_only:
+    if generate_only:
         if not check_dependencies():
             print("\n❌ Dependencies are missing. Install them first by running without --generate-only")
             sys.exit(1)
@@ -169,13 +218,14 @@ def main() -> None:
         return
     
     # Default flow: install dependencies (if needed) and generate figures
-    if not args.install_only:
+    if not install_only:
         # Check if dependencies are already installed
         deps_available = check_dependencies()
         
         if not deps_available:
             print("\n📦 Installing missing dependencies...")
-            if not install_dependencies():
+            # Something is missing, so a matching stamp is stale
+            if not install_dependencies(force=True):
                 sys.exit(1)
             
             # Re-check dependencies after installation
@@ -186,7 +236,9 @@ def main() -> None:
         if not install_dependencies():
             sys.exit(1)
         if not check_dependencies():
-            sys.exit(1)
+            # Packages removed after the last install leave a stale stamp; retry once with pip
+            if not install_dependencies(force=True) or not check_dependencies():
+                sys.exit(1)
         print("\n✅ Installation completed!")
         return
     
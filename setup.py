@@ -5,13 +5,17 @@ Setup script for Research Paper Figure Generator
 A Python toolkit for creating publication-ready figures for research papers.
 """
 
+import sys
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+try:
+    with open("README.md", "r", encoding="utf-8") as fh:
+        long_description = fh.read()
 
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+    with open("requirements.txt", "r", encoding="utf-8") as fh:
+        requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+except FileNotFoundError as e:
+    sys.exit(f"{e.filename} not found; run setup.py from the project root")
 
 setup(
     name="research-figure-generator",
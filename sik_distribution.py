@@ -5,17 +5,22 @@ Distribusi Klinik Berdasarkan Sumber Sistem Informasi Kesehatan
 Script ini menghasilkan visualisasi distribusi klinik berdasarkan sumber sistem informasi kesehatan yang digunakan.
 """
 
-import matplotlib.pyplot as plt
-import pandas as pd
-from typing import Dict
+from matplotlib.patheffects import withSimplePatchShadow
+from typing import Dict, Sequence
 from style_guide import (
     apply_style,
     save_figure,
+    show_figure,
+    prepare_figure,
+    render_charts,
+    data_signature,
     get_color_palette,
     configure_bar_plot,
     configure_pie_plot,
     add_value_labels,
-    format_percentage_labels,
+    add_total_annotation,
+    prepare_counts,
+    CategoryCounts,
     COLORS
 )
 
@@ -31,58 +36,38 @@ def get_sik_data() -> Dict[str, int]:
         'Lainnya': 5
     }
 
-def create_dataframe(data: Dict[str, int]) -> pd.DataFrame:
-    df = pd.DataFrame(list(data.items()), columns=pd.Index(['Sumber Sistem Informasi Kesehatan', 'Jumlah Klinik']))
-    df['Persentase'] = (df['Jumlah Klinik'] / df['Jumlah Klinik'].sum()) * 100
-    # Sort by 'Jumlah Klinik' descending for better chart readability
-    df = df.sort_values('Jumlah Klinik', ascending=False).reset_index(drop=True)
-    return df
-
-def create_bar_chart(data: Dict[str, int], save_path: str = 'sik_distribution_bar') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(12, 6))
-    colors = get_color_palette(len(data))
-    bars = ax.bar(df['Sumber Sistem Informasi Kesehatan'], df['Jumlah Klinik'], color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
+def create_bar_chart(prepared: CategoryCounts, save_path: str = 'sik_distribution_bar') -> None:
+    fig, ax = prepare_figure((12, 6))
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.bar(prepared.labels, prepared.counts, color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
     configure_bar_plot(
         ax,
         'Distribusi Klinik Berdasarkan Sumber Sistem Informasi Kesehatan',
         'Sumber Sistem Informasi Kesehatan',
         'Jumlah Klinik'
     )
-    add_value_labels(ax, bars, df['Jumlah Klinik'].tolist())
-    for i, (bar, count, pct) in enumerate(zip(bars, df['Jumlah Klinik'], df['Persentase'])):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height/2,
-                f'{pct:.1f}%',
-                ha='center', va='center',
-                fontsize=11, fontweight='bold',
-                color='white')
-    ax.set_ylim(0, max(df['Jumlah Klinik']) * 1.1)
-    total = df['Jumlah Klinik'].sum()
-    ax.text(0.98, 0.98, f'Total Klinik: {total}',
-            transform=ax.transAxes,
-            ha='right', va='top',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
-            fontsize=10)
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
+    add_value_labels(ax, bars, list(prepared.counts))
+    ax.bar_label(bars, labels=[f'{pct:.1f}%' for pct in prepared.percentages],
+                 label_type='center',
+                 fontsize=11, fontweight='bold',
+                 color='white')
+    ax.set_ylim(0, max(prepared.counts) * 1.1)
+    add_total_annotation(ax, prepared.total)
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    show_figure(fig)
 
-def create_pie_chart(data: Dict[str, int], save_path: str = 'sik_distribution_pie') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(8, 8))
-    colors = get_color_palette(len(data))
-    percentages = format_percentage_labels(df['Jumlah Klinik'].tolist())
-    labels = [f'{sumber}\n({jumlah} klinik, {pct})' for sumber, jumlah, pct in zip(df['Sumber Sistem Informasi Kesehatan'], df['Jumlah Klinik'], percentages)]
+def create_pie_chart(prepared: CategoryCounts, save_path: str = 'sik_distribution_pie') -> None:
+    fig, ax = prepare_figure((8, 8))
+    colors = get_color_palette(len(prepared.labels))
+    labels = [f'{sumber}\n({jumlah} klinik, {pct:.1f}%)' for sumber, jumlah, pct in zip(prepared.labels, prepared.counts, prepared.percentages)]
     pie_result = ax.pie(
-        df['Jumlah Klinik'],
+        prepared.counts,
         labels=labels,
         colors=colors,
         autopct='',
         startangle=90,
-        explode=[0.05 if count > 0 else 0 for count in df['Jumlah Klinik']],
-        shadow=True,
+        explode=[0.05 if count > 0 else 0 for count in prepared.counts],
+        shadow=False,
         textprops={'fontsize': 11}
     )
     if len(pie_result) == 3:
@@ -90,91 +75,105 @@ def create_pie_chart(data: Dict[str, int], save_path: str = 'sik_distribution_pi
     else:
         wedges, texts = pie_result
         autotexts = []
+    # Bayangan digambar sebagai path effect, bukan salinan geometri wedge dari shadow=True
+    for wedge in wedges:
+        wedge.set_path_effects([withSimplePatchShadow(offset=(2, -2), alpha=0.3)])
     for autotext in autotexts:
         autotext.set_color('white')
         autotext.set_fontweight('bold')
         autotext.set_fontsize(12)
     configure_pie_plot(ax, 'Distribusi Klinik Berdasarkan Sumber Sistem Informasi Kesehatan')
-    total = df['Jumlah Klinik'].sum()
-    ax.text(0, -1.3, f'Total Klinik: {total}',
-            ha='center', va='center',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.9),
-            fontsize=12, fontweight='bold')
+    add_total_annotation(ax, prepared.total, loc='below')
     ax.set_aspect('equal')
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    show_figure(fig)
 
-def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'sik_distribution_horizontal') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(12, 6))
-    colors = get_color_palette(len(data))
-    bars = ax.barh(df['Sumber Sistem Informasi Kesehatan'], df['Jumlah Klinik'], color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
+def create_horizontal_bar_chart(prepared: CategoryCounts, save_path: str = 'sik_distribution_horizontal') -> None:
+    fig, ax = prepare_figure((12, 6))
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.barh(prepared.labels, prepared.counts, color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
     ax.set_title('Distribusi Klinik Berdasarkan Sumber Sistem Informasi Kesehatan', fontweight='bold', pad=20, fontsize=14)
     ax.set_xlabel('Jumlah Klinik', fontsize=12)
     ax.set_ylabel('Sumber Sistem Informasi Kesehatan', fontsize=12)
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
-    for i, (bar, count, pct) in enumerate(zip(bars, df['Jumlah Klinik'], df['Persentase'])):
-        width = bar.get_width()
-        ax.text(width + width*0.02, bar.get_y() + bar.get_height()/2,
-                f'{count} ({pct:.1f}%)',
-                ha='left', va='center',
-                fontsize=11, fontweight='bold',
-                color=COLORS['dark_gray'])
-    ax.set_xlim(0, max(df['Jumlah Klinik']) * 1.15)
-    total = df['Jumlah Klinik'].sum()
-    ax.text(0.98, 0.02, f'Total Klinik: {total}',
-            transform=ax.transAxes,
-            ha='right', va='bottom',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
-            fontsize=10)
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
+    ax.bar_label(bars,
+                 labels=[f'{count} ({pct:.1f}%)' for count, pct in zip(prepared.counts, prepared.percentages)],
+                 label_type='edge', padding=3,
+                 fontsize=11, fontweight='bold',
+                 color=COLORS['dark_gray'])
+    ax.set_xlim(0, max(prepared.counts) * 1.15)
+    add_total_annotation(ax, prepared.total, loc='lower right')
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    show_figure(fig)
 
-def print_summary_statistics(data: Dict[str, int]) -> None:
-    df = create_dataframe(data)
-    total = df['Jumlah Klinik'].sum()
+def print_summary_statistics(prepared: CategoryCounts) -> None:
+    total = prepared.total
     print("\n" + "="*50)
     print("STATISTIK DISTRIBUSI KLINIK BERDASARKAN SUMBER SISTEM INFORMASI KESEHATAN")
     print("="*50)
-    for _, row in df.iterrows():
-        sumber = row['Sumber Sistem Informasi Kesehatan']
-        count = row['Jumlah Klinik']
-        percentage = row['Persentase']
+    for sumber, count, percentage in zip(prepared.labels, prepared.counts, prepared.percentages):
         print(f"{sumber:30}: {count:3d} klinik ({percentage:5.1f}%)")
     print("-"*50)
     print(f"{'Total':30}: {total:3d} klinik (100.0%)")
     print("="*50)
     print("\nWAWASAN KUNCI:")
-    primary_sumber = df.loc[df['Jumlah Klinik'].idxmax(), 'Sumber Sistem Informasi Kesehatan']
-    primary_percentage = df.loc[df['Jumlah Klinik'].idxmax(), 'Persentase']
+    # prepare_counts() mengurutkan menurun, jadi sumber terbanyak ada di urutan pertama
+    primary_sumber = prepared.labels[0]
+    primary_percentage = prepared.percentages[0]
     print(f"• Sumber '{primary_sumber}' merupakan pilihan terbanyak dengan {primary_percentage:.1f}% dari total klinik")
     # Rasio dua kategori terbanyak
-    sorted_df = df.sort_values('Jumlah Klinik', ascending=False)
-    if len(sorted_df) > 1 and sorted_df.iloc[1]['Jumlah Klinik'] > 0:
-        ratio = sorted_df.iloc[0]['Jumlah Klinik'] / sorted_df.iloc[1]['Jumlah Klinik']
-        print(f"• Rasio {sorted_df.iloc[0]['Sumber Sistem Informasi Kesehatan']} terhadap {sorted_df.iloc[1]['Sumber Sistem Informasi Kesehatan']}: {ratio:.1f}:1")
+    if len(prepared.counts) > 1 and prepared.counts[1] > 0:
+        ratio = prepared.counts[0] / prepared.counts[1]
+        print(f"• Rasio {prepared.labels[0]} terhadap {prepared.labels[1]}: {ratio:.1f}:1")
 
-def main() -> None:
-    apply_style()
+# Chart yang bisa dipilih lewat --charts: (fungsi, nama di pesan progres, nama file output)
+CHARTS = {
+    'bar': (create_bar_chart, 'diagram batang', 'sik_distribution_bar'),
+    'pie': (create_pie_chart, 'diagram lingkaran', 'sik_distribution_pie'),
+    'horizontal': (create_horizontal_bar_chart, 'diagram batang horizontal', 'sik_distribution_horizontal'),
+}
+
+def main(charts: Sequence[str] = tuple(CHARTS), force: bool = False) -> None:
     data = get_sik_data()
-    print_summary_statistics(data)
+    # Data disiapkan sekali lalu dipakai oleh ringkasan dan chart
+    prepared = prepare_counts(data)
+    print_summary_statistics(prepared)
+    if not charts:
+        # Hanya statistik: style dan render dilewati
+        return
+    apply_style()
     print("\nMembuat visualisasi...")
-    print("\n1. Membuat diagram batang...")
-    create_bar_chart(data)
-    print("\n2. Membuat diagram lingkaran...")
-    create_pie_chart(data)
-    print("\n3. Membuat diagram batang horizontal...")
-    create_horizontal_bar_chart(data)
+    for number, name in enumerate(charts, 1):
+        print(("\n" if number == 1 else "") + f"{number}. Membuat {CHARTS[name][1]}...")
+    # Chart saling lepas (figure dan file sendiri), jadi dirender paralel di proses terpisah;
+    # chart yang output-nya masih cocok dengan data dan kode saat ini dilewati
+    render_charts(
+        [(CHARTS[name][0], CHARTS[name][2]) for name in charts],
+        (prepared,),
+        data_signature(data, __file__),
+        force=force,
+    )
     print("\n✅ Semua visualisasi berhasil dibuat!")
     print("\nFile yang dihasilkan di direktori 'output/':")
-    print("• sik_distribution_bar.png/.svg")
-    print("• sik_distribution_pie.png/.svg")
-    print("• sik_distribution_horizontal.png/.svg")
+    for name in charts:
+        print(f"• {CHARTS[name][2]}.png/.svg")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate health information system source distribution figures")
+    parser.add_argument("--charts", choices=["all", *CHARTS, "none"], default="all",
+                        help="Which chart to render (default: all)")
+    parser.add_argument("--stats-only", action="store_true",
+                        help="Only print the summary statistics; same as --charts none")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render figures even when their outputs are up to date")
+    args = parser.parse_args()
+
+    if args.stats_only or args.charts == "none":
+        main(charts=())
+    elif args.charts == "all":
+        main(force=args.force)
+    else:
+        main(charts=(args.charts,), force=args.force)
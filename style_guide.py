@@ -13,10 +13,21 @@ Usage:
     save_figure('figure_name.png')
 """
 
-import matplotlib.pyplot as plt
+import hashlib
+import os
+from functools import lru_cache
+import multiprocessing as mp
 import matplotlib as mpl
-from typing import Dict, List, Tuple, Optional
-import seaborn as sns
+
+# Figures are exported to files; only use a GUI backend when explicitly requested
+INTERACTIVE = os.environ.get("FIGS_INTERACTIVE") == "1"
+if not INTERACTIVE:
+    mpl.use("Agg")
+
+# pyplot is imported inside the functions that draw, so scripts can import the
+# data helpers (e.g. prepare_counts for a stats-only run) without loading it
+from matplotlib.patches import BoxStyle
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Optional, Sequence
 
 # =============================================================================
 # COLOR PALETTE
@@ -77,15 +88,49 @@ LAYOUT = {
     'tick_length': 4,            # Tick mark length
 }
 
+# Rounded text-box styles for annotations, built once so each label reuses the
+# instance instead of parsing a 'round,pad=...' string
+BOX_STYLES = {
+    'label': BoxStyle.Round(pad=0.2),    # Value labels on data points
+    'note': BoxStyle.Round(pad=0.3),     # Small footnotes (scale, gap)
+    'total': BoxStyle.Round(pad=0.5),    # Totals and summary boxes
+}
+
+# Box around the "Total Klinik" annotation shared by the distribution charts
+TOTAL_BOX_STYLE = dict(boxstyle=BOX_STYLES['total'], facecolor=COLORS['light_gray'],
+                       edgecolor=COLORS['neutral'], alpha=0.8)
+
+# zlib level for PNG output. Level 1 compresses flat-colour charts several times
+# faster than the default (6), at roughly 1.5x the file size; set FIGS_PNG_LEVEL=6
+# (or up to 9) when file size matters more than export time.
+PNG_COMPRESS_LEVEL = int(os.environ.get('FIGS_PNG_LEVEL', '1'))
+
+# SVG text is written as <text> elements (editable, tiny files) and rendered with
+# the viewer's installed font. Set FIGS_SVG_PORTABLE=1 to embed glyphs as paths
+# instead, for machines where the figure font is not available.
+SVG_FONTTYPE = 'path' if os.environ.get('FIGS_SVG_PORTABLE') == '1' else 'none'
+
 # =============================================================================
 # STYLE APPLICATION FUNCTIONS
 # =============================================================================
 
-def apply_style() -> None:
+# Set once apply_style() has configured matplotlib in this process
+_STYLE_APPLIED = False
+
+def apply_style(force: bool = False) -> None:
     """
     Apply the research paper style guide to matplotlib.
     Call this function before creating any plots.
+    
+    The style is applied once per process; later calls return immediately
+    unless force is True (e.g. after rcParams were changed by hand).
     """
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED and not force:
+        return
+    
+    import matplotlib.pyplot as plt
+    
     # Set the overall style
     plt.style.use('default')
     
@@ -140,7 +185,12 @@ def apply_style() -> None:
         
         # Text settings
         'text.color': COLORS['dark_gray'],
+        
+        # SVG settings: fixed salt keeps generated element ids reproducible
+        'svg.hashsalt': 'research-figures',
+        'svg.fonttype': SVG_FONTTYPE,
     })
+    _STYLE_APPLIED = True
 
 def get_color_palette(n_colors: int = 8) -> list[str]:
     """
@@ -148,29 +198,40 @@ def get_color_palette(n_colors: int = 8) -> list[str]:
     - 2 kategori: monokrom
     - 3-5 kategori: monokrom + biru, hijau, oranye
     - >5: extend dengan warna profesional
+    
+    Palettes are computed once per size; every call returns a new list.
     """
+    return list(_cached_color_palette(n_colors))
+
+@lru_cache(maxsize=16)
+def _cached_color_palette(n_colors: int) -> Tuple[str, ...]:
+    """Palette lookup behind get_color_palette(), memoized per palette size."""
     if n_colors == 2:
-        return ['#181A1B', '#7F8C8D']
+        return ('#181A1B', '#7F8C8D')
     elif n_colors <= 5:
-        base = ['#181A1B', '#7F8C8D', '#3498DB', '#27AE60', '#F39C12']
+        base = ('#181A1B', '#7F8C8D', '#3498DB', '#27AE60', '#F39C12')
         return base[:n_colors]
     else:
         # Extended palette, tetap harmonis
-        extended = [
+        extended = (
             '#181A1B', '#7F8C8D', '#3498DB', '#27AE60', '#F39C12',
             '#8E44AD', '#E74C3C', '#16A085', '#34495E', '#95A5A6'
-        ]
+        )
         if n_colors <= len(extended):
             return extended[:n_colors]
         else:
+            # seaborn (and the pandas it pulls in) is only needed past the built-in
+            # palette, so it is imported here on first use instead of at module level
             import seaborn as sns
-            return sns.color_palette("tab10", n_colors).as_hex()
+            return tuple(sns.color_palette("tab10", n_colors).as_hex())
 
 def save_figure(filename: str, 
                 format: str = 'png', 
                 dpi: Optional[int] = None,
                 bbox_inches: str = 'tight',
-                pad_inches: float = 0.1) -> None:
+                pad_inches: float = 0.1,
+                fig=None,
+                formats: Optional[Sequence[str]] = None) -> None:
     """
     Save figure with consistent settings for publication.
     
@@ -180,24 +241,181 @@ def save_figure(filename: str,
         dpi: Resolution (defaults to style guide setting)
         bbox_inches: Bounding box setting
         pad_inches: Padding around the figure
+        fig: Figure to save (defaults to the current pyplot figure)
+        formats: Several formats to write from the same figure, e.g.
+            ('png', 'svg'); takes precedence over format
     """
     if dpi is None:
         dpi = LAYOUT['dpi']
+    if fig is None:
+        import matplotlib.pyplot as plt
+        fig = plt.gcf()
+    
+    formats = formats or (format,)
+    get_renderer = getattr(fig.canvas, 'get_renderer', None)
+    if (len(formats) > 1 and bbox_inches == 'tight'
+            and get_renderer is not None and fig.get_layout_engine() is None):
+        # savefig would measure the tight box with an extra draw pass per format;
+        # measure it once with the Agg renderer and reuse it for every file
+        bbox_inches = fig.get_tightbbox(get_renderer()).padded(pad_inches)
+    
+    for fmt in formats:
+        # Add extension if not provided
+        path = filename if filename.endswith(f'.{fmt}') else f"{filename}.{fmt}"
+        
+        format_kwargs = {}
+        if fmt == 'png':
+            format_kwargs['pil_kwargs'] = {'compress_level': PNG_COMPRESS_LEVEL}
+        elif fmt == 'svg':
+            # No timestamp, so unchanged figures produce byte-identical files
+            format_kwargs['metadata'] = {'Date': None}
+        
+        fig.savefig(
+            path,
+            format=fmt,
+            dpi=dpi,
+            bbox_inches=bbox_inches,
+            pad_inches=pad_inches,
+            facecolor='white',
+            edgecolor='none',
+            **format_kwargs
+        )
+        print(f"Figure saved as: {path}")
+
+def show_figure(fig=None) -> None:
+    """
+    Display a figure in interactive runs, then release it.
+    
+    Batch runs (the default) skip the GUI event loop entirely; set
+    FIGS_INTERACTIVE=1 to open a window for each figure.
+    
+    Args:
+        fig: Figure to show and close (defaults to the current figure)
+    """
+    import matplotlib.pyplot as plt
+    
+    if fig is None:
+        fig = plt.gcf()
+    if INTERACTIVE:
+        fig.tight_layout()
+        plt.show()
+    plt.close(fig)
+
+def prepare_figure(figsize: Tuple[float, float], fig=None, **subplot_kw):
+    """
+    Get a figure with a single axes for a chart, reusing fig when given.
+    
+    A reused figure is cleared and resized instead of allocating a new figure
+    and canvas, which helps when several charts are rendered one after another.
+    
+    Args:
+        figsize: Figure size (width, height) in inches
+        fig: Figure to reuse (a new figure is created when None)
+        **subplot_kw: Axes keyword arguments, e.g. projection='polar'
+        
+    Returns:
+        Tuple of (figure, axes)
+    """
+    if fig is None:
+        import matplotlib.pyplot as plt
+        return plt.subplots(figsize=figsize, subplot_kw=subplot_kw or None)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig, fig.add_subplot(**subplot_kw)
+
+def _render_task(func: Callable[..., None], args: Tuple[Any, ...]) -> None:
+    """Run a single chart function inside a worker process."""
+    func(*args)
+
+def render_parallel(tasks: Sequence[Tuple[Callable[..., None], Tuple[Any, ...]]]) -> None:
+    """
+    Render independent charts in separate processes.
+    
+    Each chart is a self-contained figure build plus file writes, so they can
+    run side by side. Workers use the 'spawn' start method so every process
+    initializes its own Agg backend, and apply the style once on start-up.
+    Interactive runs render serially so figures are shown in this process,
+    as do single-core machines.
+    
+    Args:
+        tasks: (chart_function, args) pairs; functions must be importable
+            module-level callables
+    """
+    processes = min(len(tasks), os.cpu_count() or 1)
+    # A single worker would only add process start-up cost
+    if INTERACTIVE or processes < 2:
+        for func, args in tasks:
+            func(*args)
+        return
     
-    # Add extension if not provided
-    if not filename.endswith(f'.{format}'):
-        filename = f"{filename}.{format}"
-    
-    plt.savefig(
-        filename,
-        format=format,
-        dpi=dpi,
-        bbox_inches=bbox_inches,
-        pad_inches=pad_inches,
-        facecolor='white',
-        edgecolor='none'
-    )
-    print(f"Figure saved as: {filename}")
+    with mp.get_context('spawn').Pool(processes, initializer=apply_style) as pool:
+        pool.starmap(_render_task, tasks)
+
+def data_signature(data: Any, *sources: str) -> str:
+    """
+    Short content hash of a chart's input data and the code that draws it.
+    
+    Output settings that change the written files (PNG compression level, DPI
+    and SVG font handling) are hashed too, so changing them re-renders cached
+    figures.
+    
+    Args:
+        data: Chart input data, hashed through its repr (so order matters)
+        sources: Source files whose edits should invalidate the figures;
+            the style guide itself is always included
+        
+    Returns:
+        Hex digest to pass to render_charts()
+    """
+    settings = (PNG_COMPRESS_LEVEL, SVG_FONTTYPE, LAYOUT['dpi'])
+    digest = hashlib.blake2b(repr((data, settings)).encode('utf-8'), digest_size=8)
+    for source in (__file__, *sources):
+        with open(source, 'rb') as fh:
+            digest.update(fh.read())
+    return digest.hexdigest()
+
+def _is_figure_current(filename: str, signature: str, formats: Sequence[str]) -> bool:
+    """Check that every output exists and was rendered with this signature."""
+    try:
+        with open(f"{filename}.sig", encoding='utf-8') as fh:
+            if fh.read() != signature:
+                return False
+    except FileNotFoundError:
+        return False
+    return all(os.path.exists(f"{filename}.{fmt}") for fmt in formats)
+
+def render_charts(charts: Sequence[Tuple[Callable[..., None], str]],
+                  args: Tuple[Any, ...],
+                  signature: str,
+                  force: bool = False,
+                  formats: Sequence[str] = ('png', 'svg')) -> None:
+    """
+    Render the charts whose outputs are missing or out of date, in parallel.
+    
+    A '<save_path>.sig' file next to each chart's outputs records the
+    signature it was rendered with; charts with a matching signature are
+    skipped.
+    
+    Args:
+        charts: (chart_function, save_path) pairs; each function is called as
+            chart_function(*args, save_path) and writes output/<save_path>.*
+        args: Leading positional arguments shared by every chart function
+        signature: data_signature() of the chart inputs
+        force: Re-render even when the outputs are up to date
+        formats: Output formats every chart is expected to write
+    """
+    pending = []
+    for chart, save_path in charts:
+        if force or not _is_figure_current(f'output/{save_path}', signature, formats):
+            pending.append((chart, save_path))
+        else:
+            print(f"Figure up to date, skipped: output/{save_path} (use --force to re-render)")
+    
+    render_parallel([(chart, (*args, save_path)) for chart, save_path in pending])
+    
+    for _, save_path in pending:
+        with open(f'output/{save_path}.sig', 'w', encoding='utf-8') as fh:
+            fh.write(signature)
 
 def format_percentage_labels(values: List[float], total: Optional[float] = None) -> List[str]:
     """
@@ -210,11 +428,15 @@ def format_percentage_labels(values: List[float], total: Optional[float] = None)
     Returns:
         List of formatted percentage strings
     """
+    return list(_cached_percentage_labels(tuple(values), total))
+
+@lru_cache(maxsize=32)
+def _cached_percentage_labels(values: Tuple[float, ...], total: Optional[float]) -> Tuple[str, ...]:
+    """Label formatting behind format_percentage_labels(), memoized per input."""
     if total is None:
         total = sum(values)
     
-    percentages = [(value / total) * 100 for value in values]
-    return [f"{pct:.1f}%" for pct in percentages]
+    return tuple(f"{(value / total) * 100:.1f}%" for value in values)
 
 def add_value_labels(ax, bars, values: List[float], format_str: str = "{:.0f}") -> None:
     """
@@ -226,13 +448,40 @@ def add_value_labels(ax, bars, values: List[float], format_str: str = "{:.0f}")
         values: Values to display
         format_str: Format string for the values
     """
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                format_str.format(value),
-                ha='center', va='bottom',
-                fontsize=FONTS['annotation_size'],
-                color=COLORS['dark_gray'])
+    ax.bar_label(bars, labels=[format_str.format(value) for value in values],
+                 label_type='edge', padding=2,
+                 fontsize=FONTS['annotation_size'],
+                 color=COLORS['dark_gray'])
+
+# =============================================================================
+# DATA PREPARATION
+# =============================================================================
+
+class CategoryCounts(NamedTuple):
+    """Category counts sorted from largest to smallest, with their percentages."""
+    labels: Tuple[str, ...]
+    counts: Tuple[int, ...]
+    percentages: Tuple[float, ...]
+    total: int
+
+def prepare_counts(data: Dict[str, int]) -> CategoryCounts:
+    """
+    Sort categorical count data for charting and compute percentages.
+    
+    The datasets behind these figures have a handful of categories, so plain
+    tuples are used instead of a pandas DataFrame.
+    
+    Args:
+        data: Dictionary mapping category labels to counts
+        
+    Returns:
+        CategoryCounts sorted by count, descending (ties keep input order)
+    """
+    items = sorted(data.items(), key=lambda item: item[1], reverse=True)
+    labels, counts = zip(*items)
+    total = sum(counts)
+    percentages = tuple(count / total * 100 for count in counts)
+    return CategoryCounts(labels, counts, percentages, total)
 
 # =============================================================================
 # COMMON PLOT CONFIGURATIONS
@@ -250,11 +499,42 @@ def configure_pie_plot(ax, title: str) -> None:
     """Configure a pie plot with standard settings."""
     ax.set_title(title, fontweight='bold', pad=20)
 
+def add_total_annotation(ax, total: int, loc: str = 'upper right') -> None:
+    """
+    Add the boxed "Total Klinik" annotation to a distribution chart.
+    
+    Args:
+        ax: Matplotlib axes object
+        total: Total number of clinics
+        loc: 'upper right' or 'lower right' corner of the axes for bar charts,
+            or 'below' to center it under a pie chart
+    """
+    if loc == 'below':
+        ax.text(0, -1.3, f'Total Klinik: {total}',
+                ha='center', va='center',
+                bbox={**TOTAL_BOX_STYLE, 'alpha': 0.9},
+                fontsize=12, fontweight='bold')
+        return
+    
+    if loc == 'upper right':
+        y, va = 0.98, 'top'
+    elif loc == 'lower right':
+        y, va = 0.02, 'bottom'
+    else:
+        raise ValueError(f"Unsupported loc: {loc!r}")
+    ax.text(0.98, y, f'Total Klinik: {total}',
+            transform=ax.transAxes,
+            ha='right', va=va,
+            bbox=TOTAL_BOX_STYLE,
+            fontsize=10)
+
 # =============================================================================
 # EXAMPLE USAGE
 # =============================================================================
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+    
     # Example of how to use the style guide
     apply_style()
     
@@ -275,7 +555,7 @@ if __name__ == "__main__":
     # Save the figure
     save_figure('sample_figure')
     
-    plt.show()
+    show_figure(fig)
     
     print("Style guide applied successfully!")
     print(f"Available colors: {list(COLORS.keys())}")
@@ -6,16 +6,20 @@ Script ini menghasilkan visualisasi distribusi klinik berdasarkan volume kunjung
 """
 
 import matplotlib.pyplot as plt
-import pandas as pd
-from typing import Dict
+from typing import Dict, Tuple
 from style_guide import (
     apply_style,
     save_figure,
+    show_figure,
+    prepare_figure,
+    render_parallel,
     get_color_palette,
     configure_bar_plot,
     configure_pie_plot,
     add_value_labels,
-    format_percentage_labels,
+    add_total_annotation,
+    prepare_counts,
+    CategoryCounts,
     COLORS
 )
 
@@ -31,57 +35,36 @@ def get_volume_data() -> Dict[str, int]:
         '> 150 pasien per hari': 0
     }
 
-def create_dataframe(data: Dict[str, int]) -> pd.DataFrame:
-    df = pd.DataFrame(list(data.items()), columns=pd.Index(['Volume Kunjungan Pasien per Hari', 'Jumlah Klinik']))
-    df['Persentase'] = (df['Jumlah Klinik'] / df['Jumlah Klinik'].sum()) * 100
-    # Sort by 'Jumlah Klinik' descending for better chart readability
-    df = df.sort_values('Jumlah Klinik', ascending=False).reset_index(drop=True)
-    return df
-
-def create_bar_chart(data: Dict[str, int], save_path: str = 'volume_kunjungan_bar') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(12, 6))
-    colors = get_color_palette(len(data))
-    bars = ax.bar(df['Volume Kunjungan Pasien per Hari'], df['Jumlah Klinik'], color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
+def _draw_bar(ax, prepared: CategoryCounts) -> None:
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.bar(prepared.labels, prepared.counts, color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
     configure_bar_plot(
         ax,
         'Distribusi Klinik Berdasarkan Volume Kunjungan Pasien per Hari',
         'Volume Kunjungan Pasien per Hari',
         'Jumlah Klinik'
     )
-    add_value_labels(ax, bars, df['Jumlah Klinik'].tolist())
-    for i, (bar, count, pct) in enumerate(zip(bars, df['Jumlah Klinik'], df['Persentase'])):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height/2,
-                f'{pct:.1f}%',
-                ha='center', va='center',
-                fontsize=11, fontweight='bold',
-                color='white')
-    ax.set_ylim(0, max(df['Jumlah Klinik']) * 1.1)
-    total = df['Jumlah Klinik'].sum()
-    ax.text(0.98, 0.98, f'Total Klinik: {total}',
-            transform=ax.transAxes,
-            ha='right', va='top',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
-            fontsize=10)
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
-
-def create_pie_chart(data: Dict[str, int], save_path: str = 'volume_kunjungan_pie') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(8, 8))
-    colors = get_color_palette(len(data))
-    percentages = format_percentage_labels(df['Jumlah Klinik'].tolist())
-    labels = [f'{kategori}\n({jumlah} klinik, {pct})' for kategori, jumlah, pct in zip(df['Volume Kunjungan Pasien per Hari'], df['Jumlah Klinik'], percentages)]
+    add_value_labels(ax, bars, list(prepared.counts))
+    ax.bar_label(bars, labels=[f'{pct:.1f}%' for pct in prepared.percentages],
+                 label_type='center',
+                 fontsize=11, fontweight='bold',
+                 color='white')
+    ax.set_ylim(0, max(prepared.counts) * 1.1)
+    add_total_annotation(ax, prepared.total)
+
+def _draw_pie(ax, prepared: CategoryCounts) -> None:
+    # Kategori bernilai 0 tidak punya wedge, jadi dilewati (tetap ada di statistik dan diagram batang);
+    # data terurut menurun sehingga kategori 0 ada di akhir dan warna kategori lain tidak bergeser
+    slices = [(kategori, jumlah, pct) for kategori, jumlah, pct in zip(prepared.labels, prepared.counts, prepared.percentages) if jumlah > 0]
+    colors = get_color_palette(len(prepared.labels))[:len(slices)]
+    labels = [f'{kategori}\n({jumlah} klinik, {pct:.1f}%)' for kategori, jumlah, pct in slices]
     pie_result = ax.pie(
-        df['Jumlah Klinik'],
+        [jumlah for _, jumlah, _ in slices],
         labels=labels,
         colors=colors,
         autopct='',
         startangle=90,
-        explode=[0.05 if count > 0 else 0 for count in df['Jumlah Klinik']],
+        explode=[0.05] * len(slices),
         shadow=True,
         textprops={'fontsize': 11}
     )
@@ -95,86 +78,106 @@ def create_pie_chart(data: Dict[str, int], save_path: str = 'volume_kunjungan_pi
         autotext.set_fontweight('bold')
         autotext.set_fontsize(12)
     configure_pie_plot(ax, 'Distribusi Klinik Berdasarkan Volume Kunjungan Pasien per Hari')
-    total = df['Jumlah Klinik'].sum()
-    ax.text(0, -1.3, f'Total Klinik: {total}',
-            ha='center', va='center',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.9),
-            fontsize=12, fontweight='bold')
+    add_total_annotation(ax, prepared.total, loc='below')
     ax.set_aspect('equal')
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
-
-def create_horizontal_bar_chart(data: Dict[str, int], save_path: str = 'volume_kunjungan_horizontal') -> None:
-    df = create_dataframe(data)
-    fig, ax = plt.subplots(figsize=(12, 6))
-    colors = get_color_palette(len(data))
-    bars = ax.barh(df['Volume Kunjungan Pasien per Hari'], df['Jumlah Klinik'], color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
+
+def _draw_horizontal_bar(ax, prepared: CategoryCounts) -> None:
+    colors = get_color_palette(len(prepared.labels))
+    bars = ax.barh(prepared.labels, prepared.counts, color=colors, edgecolor='white', linewidth=1.5, alpha=0.8)
     ax.set_title('Distribusi Klinik Berdasarkan Volume Kunjungan Pasien per Hari', fontweight='bold', pad=20, fontsize=14)
     ax.set_xlabel('Jumlah Klinik', fontsize=12)
     ax.set_ylabel('Volume Kunjungan Pasien per Hari', fontsize=12)
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
-    for i, (bar, count, pct) in enumerate(zip(bars, df['Jumlah Klinik'], df['Persentase'])):
-        width = bar.get_width()
-        ax.text(width + width*0.02, bar.get_y() + bar.get_height()/2,
-                f'{count} ({pct:.1f}%)',
-                ha='left', va='center',
-                fontsize=11, fontweight='bold',
-                color=COLORS['dark_gray'])
-    ax.set_xlim(0, max(df['Jumlah Klinik']) * 1.15)
-    total = df['Jumlah Klinik'].sum()
-    ax.text(0.98, 0.02, f'Total Klinik: {total}',
-            transform=ax.transAxes,
-            ha='right', va='bottom',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor=COLORS['light_gray'], edgecolor=COLORS['neutral'], alpha=0.8),
-            fontsize=10)
-    save_figure(f'output/{save_path}', format='png')
-    save_figure(f'output/{save_path}', format='svg')
-    plt.tight_layout()
-    plt.show()
-
-def print_summary_statistics(data: Dict[str, int]) -> None:
-    df = create_dataframe(data)
-    total = df['Jumlah Klinik'].sum()
+    ax.bar_label(bars,
+                 labels=[f'{count} ({pct:.1f}%)' for count, pct in zip(prepared.counts, prepared.percentages)],
+                 label_type='edge', padding=3,
+                 fontsize=11, fontweight='bold',
+                 color=COLORS['dark_gray'])
+    ax.set_xlim(0, max(prepared.counts) * 1.15)
+    add_total_annotation(ax, prepared.total, loc='lower right')
+
+def _create_chart(draw, figsize: Tuple[float, float], prepared: CategoryCounts, save_path: str) -> None:
+    fig, ax = prepare_figure(figsize)
+    draw(ax, prepared)
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    show_figure(fig)
+
+def create_bar_chart(prepared: CategoryCounts, save_path: str = 'volume_kunjungan_bar') -> None:
+    _create_chart(_draw_bar, (12, 6), prepared, save_path)
+
+def create_pie_chart(prepared: CategoryCounts, save_path: str = 'volume_kunjungan_pie') -> None:
+    _create_chart(_draw_pie, (8, 8), prepared, save_path)
+
+def create_horizontal_bar_chart(prepared: CategoryCounts, save_path: str = 'volume_kunjungan_horizontal') -> None:
+    _create_chart(_draw_horizontal_bar, (12, 6), prepared, save_path)
+
+def create_all_charts(prepared: CategoryCounts, save_path: str = 'volume_kunjungan_combined') -> None:
+    # Ringkasan untuk laporan/dashboard: ketiga chart berdampingan dalam satu figure,
+    # digambar dalam satu kali render. File per chart tetap dibuat oleh create_*_chart.
+    fig, (ax_bar, ax_pie, ax_horizontal) = plt.subplots(1, 3, figsize=(32, 8))
+    _draw_bar(ax_bar, prepared)
+    # Panel batang lebih sempit dari chart tunggalnya, jadi label kategori dimiringkan agar tidak bertumpuk
+    plt.setp(ax_bar.get_xticklabels(), rotation=20, ha='right')
+    _draw_pie(ax_pie, prepared)
+    _draw_horizontal_bar(ax_horizontal, prepared)
+    save_figure(f'output/{save_path}', formats=('png', 'svg'), fig=fig)
+    show_figure(fig)
+
+def print_summary_statistics(prepared: CategoryCounts) -> None:
+    total = prepared.total
     print("\n" + "="*50)
     print("STATISTIK DISTRIBUSI KLINIK BERDASARKAN VOLUME KUNJUNGAN PASIEN PER HARI")
     print("="*50)
-    for _, row in df.iterrows():
-        kategori = row['Volume Kunjungan Pasien per Hari']
-        count = row['Jumlah Klinik']
-        percentage = row['Persentase']
+    for kategori, count, percentage in zip(prepared.labels, prepared.counts, prepared.percentages):
         print(f"{kategori:25}: {count:3d} klinik ({percentage:5.1f}%)")
     print("-"*50)
     print(f"{'Total':25}: {total:3d} klinik (100.0%)")
     print("="*50)
     print("\nWAWASAN KUNCI:")
-    primary_kategori = df.loc[df['Jumlah Klinik'].idxmax(), 'Volume Kunjungan Pasien per Hari']
-    primary_percentage = df.loc[df['Jumlah Klinik'].idxmax(), 'Persentase']
+    # prepare_counts() mengurutkan menurun, jadi kategori mayoritas ada di urutan pertama
+    primary_kategori = prepared.labels[0]
+    primary_percentage = prepared.percentages[0]
     print(f"• Kategori '{primary_kategori}' merupakan mayoritas dengan {primary_percentage:.1f}% dari total klinik")
     # Rasio dua kategori terbanyak
-    sorted_df = df.sort_values('Jumlah Klinik', ascending=False)
-    if len(sorted_df) > 1 and sorted_df.iloc[1]['Jumlah Klinik'] > 0:
-        ratio = sorted_df.iloc[0]['Jumlah Klinik'] / sorted_df.iloc[1]['Jumlah Klinik']
-        print(f"• Rasio {sorted_df.iloc[0]['Volume Kunjungan Pasien per Hari']} terhadap {sorted_df.iloc[1]['Volume Kunjungan Pasien per Hari']}: {ratio:.1f}:1")
+    if len(prepared.counts) > 1 and prepared.counts[1] > 0:
+        ratio = prepared.counts[0] / prepared.counts[1]
+        print(f"• Rasio {prepared.labels[0]} terhadap {prepared.labels[1]}: {ratio:.1f}:1")
 
-def main() -> None:
+def main(overview: bool = False) -> None:
     apply_style()
     data = get_volume_data()
-    print_summary_statistics(data)
+    # Data diurutkan dan persentase dihitung sekali untuk ringkasan dan ketiga chart
+    prepared = prepare_counts(data)
+    print_summary_statistics(prepared)
     print("\nMembuat visualisasi...")
     print("\n1. Membuat diagram batang...")
-    create_bar_chart(data)
-    print("\n2. Membuat diagram lingkaran...")
-    create_pie_chart(data)
-    print("\n3. Membuat diagram batang horizontal...")
-    create_horizontal_bar_chart(data)
+    print("2. Membuat diagram lingkaran...")
+    print("3. Membuat diagram batang horizontal...")
+    tasks = [
+        (create_bar_chart, (prepared,)),
+        (create_pie_chart, (prepared,)),
+        (create_horizontal_bar_chart, (prepared,)),
+    ]
+    if overview:
+        print("4. Membuat ringkasan tiga panel...")
+        tasks.append((create_all_charts, (prepared,)))
+    # Setiap chart saling lepas (figure dan file sendiri), jadi dirender paralel di proses terpisah
+    render_parallel(tasks)
     print("\n✅ Semua visualisasi berhasil dibuat!")
     print("\nFile yang dihasilkan di direktori 'output/':")
     print("• volume_kunjungan_bar.png/.svg")
     print("• volume_kunjungan_pie.png/.svg")
     print("• volume_kunjungan_horizontal.png/.svg")
+    if overview:
+        print("• volume_kunjungan_combined.png/.svg")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate patient visit volume distribution figures")
+    parser.add_argument("--overview", action="store_true",
+                        help="Also save the three charts side by side as volume_kunjungan_combined")
+    args = parser.parse_args()
+
+    main(overview=args.overview) 
\ No newline at end of file